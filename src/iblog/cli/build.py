@@ -1,26 +1,28 @@
 """统一构建入口：编排所有生成器"""
 
 import typer
+from concurrent.futures import ThreadPoolExecutor
+from importlib.resources import files
 from pathlib import Path
 from loguru import logger
 
-# 导入配置系统
-from iblog.core.config_loader import ConfigLoader
-from iblog.core.config_models import Config
+# 核心层和生成器层（依赖 pydantic、jinja2、markdown-it）均在 build() 内按需导入，
+# 使 iblog --help 等不需要构建的调用无需加载这些依赖
 
-# 导入核心层
-from iblog.core.metadata_parser import MetadataParser
-from iblog.core.file_scanner import FileScanner
-from iblog.core.template_renderer import TemplateRenderer
 
-# 导入生成器层
-from iblog.generators.post_generator import PostGenerator
-from iblog.generators.index_generator import IndexGenerator
-from iblog.generators.category_generator import CategoryGenerator
-from iblog.generators.tag_generator import TagGenerator
+app = typer.Typer(help="静态博客生成工具")
 
+_SEP = "=" * 50
 
-app = typer.Typer(help="静态博客生成工具")
+# 模板随包发布，模块导入时解析一次
+_TEMPLATE_DIR = Path(str(files("iblog") / "templates"))
+
+
+def _section(message: str | None = None):
+    """输出分隔线，并可附带一条说明"""
+    logger.info(_SEP)
+    if message:
+        logger.info(message)
 
 
 @app.command()
@@ -40,11 +42,19 @@ def build(
     ),
 ):
     """构建完整的博客站点"""
-    logger.info("=" * 50)
-    logger.info("开始构建博客站点")
-    logger.info(f"输入目录: {input_dir}")
-    logger.info(f"输出目录: {output_dir}")
-    logger.info("=" * 50)
+    _section("开始构建博客站点")
+    logger.info("输入目录: {}", input_dir)
+    logger.info("输出目录: {}", output_dir)
+    logger.info(_SEP)
+
+    # 导入配置系统和核心层
+    from iblog.core.config_loader import ConfigLoader
+    from iblog.core.config_models import Config
+    from iblog.core.metadata_parser import MetadataParser
+    from iblog.core.file_scanner import FileScanner
+    from iblog.core.template_renderer import TemplateRenderer
+    from iblog.core.file_writer import BackgroundWriter, BundleWriter
+    from iblog.core.logging_setup import setup_logging
 
     # 加载配置文件
     try:
@@ -53,77 +63,128 @@ def build(
         logger.error(f"加载配置失败: {e}")
         raise typer.Exit(code=1)
 
+    # 按配置设置日志级别和输出
+    setup_logging(config.logging)
+
     # 初始化核心组件（传入配置）
     parser = MetadataParser(config)
     scanner = FileScanner(parser, config)
-    template_dir = Path(__file__).parent.parent.parent.parent / "templates"
-    renderer = TemplateRenderer(template_dir, config)
+    renderer = TemplateRenderer(_TEMPLATE_DIR, config)
+    if config.build.incremental or config.build.parallel:
+        # 预先编译模板：写入字节码缓存供后续构建和工作进程使用，并避免多个线程首次渲染时重复编译
+        renderer.precompile()
 
     # 一次性扫描所有文章
-    logger.info(f"扫描目录: {input_dir}")
+    logger.info("扫描目录: {}", input_dir)
     posts = scanner.scan_directory(input_dir)
     posts = scanner.sort_by_pinned_and_date(posts, reverse=True)
-    logger.info(f"找到 {len(posts)} 篇文章")
+    logger.info("找到 {} 篇文章", len(posts))
 
     if len(posts) == 0:
         logger.warning("未找到任何 Markdown 文件，退出构建")
         return
 
+    # 一次性创建各生成器的输出目录（打包输出时页面不落盘，无需创建）
+    about_file = input_dir / "about.md"
+    if not config.build.bundle_output:
+        from iblog.generators.base_generator import ensure_output_dirs
+
+        generators, output_paths = config.features.generators, config.paths.output
+        ensure_output_dirs(output_dir, [
+            subdir
+            for enabled, subdir in (
+                (generators.posts, output_paths.posts),
+                (generators.categories, output_paths.categories),
+                (generators.tags, output_paths.tags),
+                (generators.about and about_file.exists(), output_paths.about),
+            )
+            if enabled
+        ])
+
     # 依次调用各个生成器（根据配置开关）
+    # 启用并行构建时，各生成器只依赖只读的 posts 和 config，提交到线程池并发执行
+    executor = ThreadPoolExecutor(max_workers=4) if config.build.parallel else None
+    # 启用打包输出或后台写入时，各生成器渲染出的页面统一交由写入器处理
+    if config.build.bundle_output:
+        writer = BundleWriter(output_dir)
+    elif config.build.background_write:
+        writer = BackgroundWriter()
+    else:
+        writer = None
+    futures = []
+
+    def run(job):
+        if executor:
+            futures.append(executor.submit(job))
+        else:
+            job()
+
     if config.features.generators.posts:
-        logger.info("=" * 50)
-        PostGenerator(renderer, config).generate(posts, output_dir)
+        _section()
+        from iblog.generators.post_generator import PostGenerator
+
+        run(lambda: PostGenerator(renderer, config, writer).generate(posts, output_dir))
     else:
-        logger.info("=" * 50)
-        logger.info("博文生成器已禁用，跳过")
+        _section("博文生成器已禁用，跳过")
 
     if config.features.generators.index:
-        logger.info("=" * 50)
-        IndexGenerator(renderer, config).generate(posts, output_dir)
+        _section()
+        from iblog.generators.index_generator import IndexGenerator
+
+        run(lambda: IndexGenerator(renderer, config, writer).generate(posts, output_dir))
     else:
-        logger.info("=" * 50)
-        logger.info("首页生成器已禁用，跳过")
+        _section("首页生成器已禁用，跳过")
 
     if config.features.generators.categories:
-        logger.info("=" * 50)
-        CategoryGenerator(renderer, config).generate(posts, output_dir)
+        _section()
+        from iblog.generators.category_generator import CategoryGenerator
+
+        run(lambda: CategoryGenerator(renderer, config, writer).generate(posts, output_dir))
     else:
-        logger.info("=" * 50)
-        logger.info("分类生成器已禁用，跳过")
+        _section("分类生成器已禁用，跳过")
 
     if config.features.generators.tags:
-        logger.info("=" * 50)
-        TagGenerator(renderer, config).generate(posts, output_dir)
+        _section()
+        from iblog.generators.tag_generator import TagGenerator
+
+        run(lambda: TagGenerator(renderer, config, writer).generate(posts, output_dir))
     else:
-        logger.info("=" * 50)
-        logger.info("标签生成器已禁用，跳过")
+        _section("标签生成器已禁用，跳过")
 
     # 检查并生成关于页面
-    about_file = input_dir / "about.md"
     if config.features.generators.about and about_file.exists():
-        logger.info("=" * 50)
+        _section()
         from iblog.generators.about_generator import AboutGenerator
 
-        AboutGenerator(renderer, config).generate(
+        run(lambda: AboutGenerator(renderer, config, writer).generate(
             about_file, output_dir, total_posts=len(posts)
-        )
+        ))
     else:
-        logger.info("=" * 50)
+        _section()
         if not config.features.generators.about:
             logger.info("关于页生成器已禁用，跳过")
         elif not about_file.exists():
             logger.info("未找到 about.md，跳过关于页面生成")
 
-    # 构建完成
-    logger.info("=" * 50)
+    # 等待并行任务完成（任一生成器失败时抛出其异常）
+    if executor:
+        with executor:
+            for future in futures:
+                future.result()
+    if writer:
+        writer.close()
+
+    # 构建完成（路径拼接延迟到日志真正输出时）
+    _section()
     logger.success("构建完成！")
+    lazy_logger = logger.opt(lazy=True)
     if config.features.generators.index:
-        logger.success(f"首页: {output_dir / 'index.html'}")
+        lazy_logger.success("首页: {}", lambda: output_dir / "index.html")
     if config.features.generators.posts:
-        logger.success(f"博文: {output_dir / config.paths.output.posts}")
+        lazy_logger.success("博文: {}", lambda: output_dir / config.paths.output.posts)
     if config.features.generators.about and about_file.exists():
-        logger.success(f"关于: {output_dir / config.paths.output.about / 'index.html'}")
-    logger.info("=" * 50)
+        lazy_logger.success("关于: {}", lambda: output_dir / config.paths.output.about / "index.html")
+    logger.info(_SEP)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+"""构建缓存读写：增量构建时在缓存目录下持久化中间结果"""
+
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+from loguru import logger
+
+
+def load_cache(path: Path, signature: Any = None) -> Any | None:
+    """从磁盘加载缓存
+    
+    Args:
+        path: 缓存文件路径
+        signature: 影响缓存内容的配置签名，与写入时不一致则缓存失效
+    
+    Returns:
+        Any | None: 缓存数据；缓存不存在、损坏或签名不一致时返回 None
+    """
+    if not path.exists():
+        return None
+    try:
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"读取缓存 {path} 失败: {e}")
+        return None
+    if not isinstance(data, dict) or data.get("signature") != signature:
+        logger.debug("缓存 {} 已失效", path.name)
+        return None
+    return data.get("data")
+
+
+def save_cache(path: Path, data: Any, signature: Any = None):
+    """将缓存写回磁盘（先写临时文件再原子替换）
+    
+    Args:
+        path: 缓存文件路径
+        data: 缓存数据
+        signature: 影响缓存内容的配置签名
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"signature": signature, "data": data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"写入缓存 {path} 失败: {e}")
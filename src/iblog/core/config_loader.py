@@ -4,6 +4,7 @@
 """
 
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from loguru import logger
 from pydantic import ValidationError
@@ -35,10 +36,35 @@ class ConfigLoader:
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
         
-        # 读取 YAML 文件
+        # 读取文件内容
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                raw_config = yaml.safe_load(f)
+            data = config_path.read_bytes()
+        except Exception as e:
+            error_msg = f"读取配置文件失败: {e}"
+            logger.error(error_msg)
+            raise
+        
+        # 以 (绝对路径, 文件内容) 为键缓存，内容未变化时直接返回同一个（只读的）配置对象
+        # 不依赖修改时间：mtime 精度较粗的文件系统上，同一时间片内的修改也能被识别
+        return ConfigLoader._load_cached(str(config_path.resolve()), data)
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _load_cached(config_path_str: str, data: bytes) -> Config:
+        """解析并验证配置文件（结果按路径和文件内容缓存）
+        
+        Args:
+            config_path_str: 配置文件的绝对路径
+            data: 配置文件内容
+            
+        Returns:
+            Config: 验证后的配置对象
+        """
+        config_path = Path(config_path_str)
+        
+        # 解析 YAML 内容
+        try:
+            raw_config = yaml.safe_load(data.decode('utf-8'))
         except yaml.YAMLError as e:
             error_msg = f"YAML 格式错误: {e}"
             logger.error(error_msg)
@@ -50,7 +76,7 @@ class ConfigLoader:
         
         # 使用 Pydantic 验证并构造配置对象
         try:
-            config = Config(**raw_config)
+            config = Config.model_validate(raw_config)
             logger.success(f"✓ 配置加载成功: {config_path}")
             logger.debug(f"站点标题: {config.site.title}")
             logger.debug(f"启用的生成器: index={config.features.generators.index}, "
@@ -7,14 +7,19 @@
 - IDE 代码补全
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional
 
 
+class FrozenModel(BaseModel):
+    """所有配置模型的基类：构建期间配置只读，可安全地在多个组件和线程间共享"""
+    model_config = ConfigDict(frozen=True)
+
+
 # ========================================
 # 站点配置
 # ========================================
-class SiteConfig(BaseModel):
+class SiteConfig(FrozenModel):
     """站点基础信息配置"""
     title: str
     subtitle: str
@@ -29,14 +34,14 @@ class SiteConfig(BaseModel):
 # ========================================
 # 导航配置
 # ========================================
-class NavigationItem(BaseModel):
+class NavigationItem(FrozenModel):
     """导航项"""
     name: str
     url: str
     icon: str = ""
 
 
-class NavigationConfig(BaseModel):
+class NavigationConfig(FrozenModel):
     """导航栏配置"""
     items: list[NavigationItem]
 
@@ -44,14 +49,14 @@ class NavigationConfig(BaseModel):
 # ========================================
 # 页脚配置
 # ========================================
-class SocialLink(BaseModel):
+class SocialLink(FrozenModel):
     """社交链接"""
     name: str
     url: str
     icon: str = ""
 
 
-class FooterConfig(BaseModel):
+class FooterConfig(FrozenModel):
     """页脚配置"""
     copyright: str
     show_powered_by: bool = True
@@ -64,7 +69,7 @@ class FooterConfig(BaseModel):
 # ========================================
 # 主题配置
 # ========================================
-class ThemeColorsConfig(BaseModel):
+class ThemeColorsConfig(FrozenModel):
     """主题颜色配置"""
     background: str = "rgb(250, 249, 245)"
     text: str = "#000"
@@ -74,26 +79,26 @@ class ThemeColorsConfig(BaseModel):
     text_secondary: str = "#666"
 
 
-class ThemeLayoutConfig(BaseModel):
+class ThemeLayoutConfig(FrozenModel):
     """主题布局配置"""
     max_width: str = "900px"
     padding: str = "20px"
     padding_mobile: str = "15px"
 
 
-class ThemeFontsConfig(BaseModel):
+class ThemeFontsConfig(FrozenModel):
     """主题字体配置"""
     body: str = "system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif"
     code: str = "Monaco, Consolas, 'Courier New', monospace"
     heading: str = ""
 
 
-class ThemeCDNConfig(BaseModel):
+class ThemeCDNConfig(FrozenModel):
     """主题 CDN 资源配置"""
     markdown_css: str = "https://cdnjs.cloudflare.com/ajax/libs/github-markdown-css/5.5.1/github-markdown.min.css"
 
 
-class ThemeConfig(BaseModel):
+class ThemeConfig(FrozenModel):
     """主题配置"""
     colors: ThemeColorsConfig = Field(default_factory=ThemeColorsConfig)
     layout: ThemeLayoutConfig = Field(default_factory=ThemeLayoutConfig)
@@ -104,7 +109,7 @@ class ThemeConfig(BaseModel):
 # ========================================
 # 功能开关配置
 # ========================================
-class GeneratorsConfig(BaseModel):
+class GeneratorsConfig(FrozenModel):
     """生成器开关配置"""
     index: bool = True
     posts: bool = True
@@ -113,13 +118,13 @@ class GeneratorsConfig(BaseModel):
     about: bool = True
 
 
-class PaginationConfig(BaseModel):
+class PaginationConfig(FrozenModel):
     """分页配置"""
     enabled: bool = False
     posts_per_page: int = 10
 
 
-class PostCardConfig(BaseModel):
+class PostCardConfig(FrozenModel):
     """文章卡片显示配置"""
     show_description: bool = True
     show_category: bool = True
@@ -130,7 +135,7 @@ class PostCardConfig(BaseModel):
     datetime_format: str = "%Y-%m-%d %H:%M"
 
 
-class FeaturesConfig(BaseModel):
+class FeaturesConfig(FrozenModel):
     """功能配置"""
     generators: GeneratorsConfig = Field(default_factory=GeneratorsConfig)
     pagination: PaginationConfig = Field(default_factory=PaginationConfig)
@@ -140,7 +145,7 @@ class FeaturesConfig(BaseModel):
 # ========================================
 # 路径配置
 # ========================================
-class PathsOutputConfig(BaseModel):
+class PathsOutputConfig(FrozenModel):
     """输出路径配置"""
     posts: str = "blogs"
     categories: str = "categories"
@@ -149,7 +154,7 @@ class PathsOutputConfig(BaseModel):
     assets: str = "assets"
 
 
-class PathsConfig(BaseModel):
+class PathsConfig(FrozenModel):
     """路径配置"""
     output: PathsOutputConfig = Field(default_factory=PathsOutputConfig)
 
@@ -157,27 +162,27 @@ class PathsConfig(BaseModel):
 # ========================================
 # 文章配置
 # ========================================
-class PostsSortConfig(BaseModel):
+class PostsSortConfig(FrozenModel):
     """文章排序配置"""
     by: Literal["date", "updated", "title"] = "date"
     order: Literal["asc", "desc"] = "desc"
 
 
-class PostsDefaultsConfig(BaseModel):
+class PostsDefaultsConfig(FrozenModel):
     """文章默认值配置"""
     category: str = "未分类"
     tags: list[str] = Field(default_factory=list)
     author: str = ""
 
 
-class PostsExcerptConfig(BaseModel):
+class PostsExcerptConfig(FrozenModel):
     """文章摘要配置"""
     auto_generate: bool = False
     length: int = 200
     suffix: str = "..."
 
 
-class PostsConfig(BaseModel):
+class PostsConfig(FrozenModel):
     """文章配置"""
     sort: PostsSortConfig = Field(default_factory=PostsSortConfig)
     defaults: PostsDefaultsConfig = Field(default_factory=PostsDefaultsConfig)
@@ -187,13 +192,13 @@ class PostsConfig(BaseModel):
 # ========================================
 # 日志配置
 # ========================================
-class LoggingFileConfig(BaseModel):
+class LoggingFileConfig(FrozenModel):
     """日志文件配置"""
     enabled: bool = False
     path: str = "logs/iblog.log"
 
 
-class LoggingConfig(BaseModel):
+class LoggingConfig(FrozenModel):
     """日志配置"""
     level: Literal["DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR"] = "INFO"
     console: bool = True
@@ -204,20 +209,28 @@ class LoggingConfig(BaseModel):
 # ========================================
 # 构建配置
 # ========================================
-class BuildConfig(BaseModel):
+class BuildConfig(FrozenModel):
     """构建配置"""
     clean_output: bool = False
     copy_assets: bool = False
     exclude: list[str] = Field(default_factory=lambda: ["*.tmp", "*.draft", "_*", ".git"])
+    drafts: bool = False  # 是否构建 frontmatter 中 draft: true 的草稿
     incremental: bool = False
+    cache_dir: str = ".iblog-cache"
     parallel: bool = False
+    background_write: bool = False  # 是否由后台线程池写出页面，使磁盘 IO 与渲染重叠
+    bundle_output: bool = False  # 是否将生成的页面打包为输出目录下的 site.zip，而非逐个写入
+    template_engine: Literal["jinja2", "minijinja"] = "jinja2"  # 模板渲染后端，minijinja 需额外安装
+    max_workers: Optional[int] = None  # 扫描线程池 / 博文渲染进程池的最大工作数，None 表示按 CPU 数自动计算
 
 
 # ========================================
 # 根配置
 # ========================================
-class Config(BaseModel):
+class Config(FrozenModel):
     """iblog 完整配置模型"""
+    model_config = ConfigDict(extra="allow")  # 允许额外字段（未来扩展）
+    
     site: SiteConfig
     navigation: Optional[NavigationConfig] = None
     footer: FooterConfig
@@ -227,7 +240,3 @@ class Config(BaseModel):
     posts: PostsConfig = Field(default_factory=PostsConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     build: BuildConfig = Field(default_factory=BuildConfig)
-    
-    class Config:
-        """Pydantic 配置"""
-        extra = "allow"  # 允许额外字段（未来扩展）
@@ -1,10 +1,20 @@
 """文件扫描器：扫描 Markdown 文件并构建文章列表"""
 
+import fnmatch
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from loguru import logger
 
-from .metadata_parser import MetadataParser
+from .build_cache import load_cache, save_cache
+from .metadata_parser import MetadataParser, peek_frontmatter
 from .config_models import Config
+from .logging_setup import debug_enabled
+
+# 判断草稿时预读的文件头大小
+_PEEK_SIZE = 4096
 
 
 class FileScanner:
@@ -19,19 +29,29 @@ class FileScanner:
         """
         self.parser = parser
         self.config = config
+        # 增量构建缓存：文件路径 -> (mtime_ns, size, metadata, content)
+        self._cache_path = Path(config.build.cache_dir) / "posts.pkl"
+        self._cache: dict[str, tuple[int, int, dict, str]] = {}
+        if config.build.incremental:
+            self._cache = self._load_cache()
+        # 预编译排除规则：普通文件名放入 frozenset，glob 模式合并为一个正则
+        self._exclude_names, self._exclude_re = self._compile_excludes(config.build.exclude)
     
     def scan_directory(self, md_dir: Path, exclude_files: list[str] = None) -> list[dict]:
         """扫描目录，返回所有文章的元数据列表
         
         Args:
             md_dir: Markdown 文件所在目录
-            exclude_files: 要排除的文件名列表（默认排除 about.md）
+            exclude_files: 要排除的文件名列表（默认排除 about.md），
+                配置中 build.exclude 的规则始终生效
             
         Returns:
             list[dict]: 文章列表，每个元素包含：
                 - file_path: Path 对象
                 - metadata: 元数据字典
                 - content: 正文内容
+                - 以下划线开头的预计算字段（排序、分组与链接等），见 _precompute_keys
+                - _mtime_ns: 源文件修改时间（纳秒）
         """
         md_dir = Path(md_dir)
         posts = []
@@ -39,33 +59,230 @@ class FileScanner:
         # 默认排除 about.md 等特殊页面
         if exclude_files is None:
             exclude_files = ["about.md"]
+        exclude_names = self._exclude_names.union(exclude_files)
+        exclude_re = self._exclude_re
         
         logger.info(f"开始扫描目录: {md_dir}")
         
-        for md_file in md_dir.glob("*.md"):
-            # 跳过排除列表中的文件
-            if md_file.name in exclude_files:
-                logger.debug(f"跳过特殊文件: {md_file.name}")
-                continue
-            
-            try:
-                md_content = md_file.read_text(encoding="utf-8")
-                metadata, content = self.parser.parse(md_content)
-                
-                posts.append({
-                    "file_path": md_file,
-                    "metadata": metadata,
-                    "content": content
-                })
+        # 1. 收集待处理的文件列表
+        # 使用 os.scandir 复用目录项缓存的类型信息，只为通过过滤的条目构造 Path
+        md_files = []
+        debug = debug_enabled()
+        with os.scandir(md_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".md") or not entry.is_file():
+                    continue
+                # 跳过排除列表中的文件
+                if entry.name in exclude_names or (exclude_re and exclude_re.match(entry.name)):
+                    if debug:
+                        logger.debug("跳过排除的文件: {}", entry.name)
+                    continue
+                md_files.append(Path(entry.path))
+        
+        # 2. 使用线程池并发读取和解析文件
+        new_cache = {}
+        with ThreadPoolExecutor(max_workers=self._max_workers()) as executor:
+            futures = {executor.submit(self._load_one, md_file): md_file for md_file in md_files}
+            for future in as_completed(futures):
+                md_file = futures[future]
+                result = future.result()
+                if isinstance(result, Exception):
+                    logger.warning(f"处理文件 {md_file} 时出错: {result}")
+                    continue
+                if result is None:
+                    if debug:
+                        logger.debug("跳过草稿: {}", md_file.name)
+                    continue
                 
-                logger.debug(f"扫描文件: {md_file.name} - {metadata.get('title', '无标题')}")
-            except Exception as e:
-                logger.warning(f"处理文件 {md_file} 时出错: {e}")
-                continue
+                post, cache_entry = result
+                posts.append(post)
+                new_cache[str(md_file)] = cache_entry
+                if debug:
+                    logger.debug("扫描文件: {} - {}", md_file.name, post["metadata"].get("title", "无标题"))
+        
+        # 保证结果顺序稳定
+        posts.sort(key=lambda p: p["file_path"])
+        
+        if self.config.build.incremental:
+            self._save_cache(new_cache)
+            self._cache = new_cache
         
         logger.info(f"扫描完成，找到 {len(posts)} 篇文章")
         return posts
     
+    def _load_one(self, md_file: Path) -> tuple[dict, tuple] | Exception | None:
+        """读取并解析单个 Markdown 文件（在工作线程中执行）
+        
+        启用增量构建时，若文件的 mtime 和 size 与缓存一致，则直接复用缓存的解析结果。
+        
+        Args:
+            md_file: Markdown 文件路径
+            
+        Returns:
+            tuple[dict, tuple] | Exception | None: (文章字典, 缓存条目)；出错时返回异常对象；草稿返回 None
+        """
+        try:
+            st = os.stat(md_file)
+            cached = self._cache.get(str(md_file))
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                metadata, content = cached[2], cached[3]
+            else:
+                # 以字节读取，由解析器在字节上定位分隔符后再解码
+                with open(md_file, "rb") as f:
+                    head = f.read(_PEEK_SIZE)
+                    # 草稿只需读取文件头即可跳过，无需读取正文
+                    if self._is_draft_head(head):
+                        return None
+                    data = head + f.read()
+                metadata, content = self.parser.parse(data)
+            # 头部超出预读范围的草稿在完整解析后再过滤
+            if not self.config.build.drafts and metadata.get("draft"):
+                return None
+            post = {
+                "file_path": md_file,
+                "metadata": metadata,
+                "content": content
+            }
+            self._precompute_keys(post)
+            # 源文件修改时间，供博文生成器判断输出是否需要更新
+            post["_mtime_ns"] = st.st_mtime_ns
+            return post, (st.st_mtime_ns, st.st_size, metadata, content)
+        except Exception as e:
+            return e
+    
+    def _is_draft_head(self, head: bytes) -> bool:
+        """根据文件头判断是否为需要跳过的草稿（frontmatter 中 draft: true）
+        
+        只有文件头中出现 draft 字样时才解析 YAML，普通文章不会被重复解析。
+        
+        Args:
+            head: 文件开头的字节
+            
+        Returns:
+            bool: 是否跳过
+        """
+        if self.config.build.drafts or b"draft" not in head:
+            return False
+        try:
+            metadata = peek_frontmatter(head)
+        except Exception:
+            # 交由完整解析流程处理错误
+            return False
+        return bool(metadata and metadata.get("draft"))
+    
+    def _precompute_keys(self, post: dict):
+        """将排序和分组用到的热点字段提升到文章字典顶层，避免下游循环反复查找 metadata
+        
+        写入的字段：
+            - _pinned: 是否置顶
+            - _sort: 按配置的排序字段取出的排序键
+            - _date: 发布日期（分类、标签页按此排序）
+            - _cat: 分类
+            - _tags: 标签列表
+            - _html_name: 博文输出文件名
+            - _url: 相对站点根目录的博文链接
+            - _subdir_url: 相对一级子目录（分类、标签页）的博文链接
+        
+        Args:
+            post: 文章字典（原地修改）
+        """
+        metadata = post["metadata"]
+        post["_pinned"] = bool(metadata.get("pinned", False))
+        post["_sort"] = self._sort_value(metadata)
+        post["_date"] = metadata.get("date", "")
+        post["_cat"] = metadata.get("category", self.config.posts.defaults.category)
+        post["_tags"] = metadata.get("tags", [])
+        post["_html_name"] = f"{post['file_path'].stem}.html"
+        post["_url"] = f"{self.config.paths.output.posts}/{post['_html_name']}"
+        post["_subdir_url"] = f"../{post['_url']}"
+    
+    def _sort_value(self, metadata: dict):
+        """按配置的排序字段从元数据中取出排序键
+        
+        Args:
+            metadata: 元数据字典
+            
+        Returns:
+            排序字段的值（缺失时为空字符串）
+        """
+        sort_by = self.config.posts.sort.by  # "date" | "updated" | "title"
+        if sort_by == "updated":
+            return metadata.get("updated", metadata.get("date", ""))
+        return metadata.get(sort_by, "")
+    
+    def _sort_key(self, post: dict) -> tuple:
+        """取文章的 (是否置顶, 排序键)
+        
+        优先使用扫描时预先计算的 _pinned、_sort，未经扫描的文章字典回退到 metadata。
+        
+        Args:
+            post: 文章字典
+            
+        Returns:
+            tuple: (是否置顶, 排序键)
+        """
+        if "_sort" in post:
+            return post["_pinned"], post["_sort"]
+        metadata = post["metadata"]
+        return bool(metadata.get("pinned", False)), self._sort_value(metadata)
+    
+    def _cache_signature(self) -> dict:
+        """影响解析结果的配置项，变化时缓存整体失效
+        
+        Returns:
+            dict: 配置签名
+        """
+        return {
+            "defaults": self.config.posts.defaults.model_dump(),
+            "author": self.config.site.author,
+        }
+    
+    def _load_cache(self) -> dict:
+        """从磁盘加载增量构建缓存
+        
+        Returns:
+            dict: 缓存字典；缓存不存在、损坏或配置已变化时返回空字典
+        """
+        cache = load_cache(self._cache_path, self._cache_signature())
+        if cache is None:
+            return {}
+        logger.debug("已加载增量缓存: {} 篇文章", len(cache))
+        return cache
+    
+    def _save_cache(self, cache: dict):
+        """将增量构建缓存写回磁盘
+        
+        Args:
+            cache: 缓存字典
+        """
+        save_cache(self._cache_path, cache, self._cache_signature())
+    
+    @staticmethod
+    def _compile_excludes(patterns: list[str]) -> tuple[frozenset, re.Pattern | None]:
+        """将排除规则拆分为普通文件名集合和合并后的 glob 正则
+        
+        Args:
+            patterns: 排除规则列表（glob 格式）
+            
+        Returns:
+            tuple[frozenset, re.Pattern | None]: (文件名集合, glob 正则；没有 glob 模式时为 None)
+        """
+        names = frozenset(p for p in patterns if not any(c in p for c in "*?["))
+        globs = [p for p in patterns if p not in names]
+        if not globs:
+            return names, None
+        return names, re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in globs))
+    
+    def _max_workers(self) -> int:
+        """获取扫描线程池的最大线程数（配置优先，否则按 CPU 数自动计算）
+        
+        Returns:
+            int: 最大线程数
+        """
+        if self.config.build.max_workers:
+            return self.config.build.max_workers
+        return min(32, (os.cpu_count() or 4) * 4)
+    
     def sort_by_date(self, posts: list[dict], reverse: bool = True) -> list[dict]:
         """按日期排序文章列表
         
@@ -92,29 +309,17 @@ class FileScanner:
         Returns:
             list[dict]: 排序后的文章列表（置顶文章在前，然后按配置排序）
         """
-        # 从配置读取排序方式
-        sort_by = self.config.posts.sort.by  # "date" | "updated" | "title"
-        sort_order = self.config.posts.sort.order  # "asc" | "desc"
-        reverse = (sort_order == "desc")
+        # 从配置读取排序方向（排序字段已在扫描时预先计算到 _pinned、_sort）
+        if self.config.posts.sort.order == "desc":
+            # 降序时置顶（True）自然排在前面
+            return sorted(posts, key=self._sort_key, reverse=True)
         
-        # 根据配置选择排序字段
-        if sort_by == "updated":
-            sort_key = lambda p: p["metadata"].get("updated", p["metadata"].get("date", ""))
-        elif sort_by == "title":
-            sort_key = lambda p: p["metadata"].get("title", "")
-        else:  # date (默认)
-            sort_key = lambda p: p["metadata"].get("date", "")
-        
-        # 先按配置的字段排序
-        sorted_posts = sorted(posts, key=sort_key, reverse=reverse)
-        
-        # 再按置顶状态排序（稳定排序，保持原有顺序）
-        sorted_posts = sorted(
-            sorted_posts,
-            key=lambda p: not p["metadata"].get("pinned", False)
-        )
+        # 升序时对置顶状态取反，使置顶文章仍排在前面
+        def ascending_key(post: dict) -> tuple:
+            pinned, value = self._sort_key(post)
+            return not pinned, value
         
-        return sorted_posts
+        return sorted(posts, key=ascending_key)
     
     def group_by_category(self, posts: list[dict]) -> dict[str, list]:
         """按分类分组文章
@@ -125,15 +330,15 @@ class FileScanner:
         Returns:
             dict[str, list]: 分类名到文章列表的映射
         """
-        categories = {}
+        categories = defaultdict(list)
+        default_category = self.config.posts.defaults.category
         
         for post in posts:
-            category = post["metadata"].get("category", "未分类")
-            if category not in categories:
-                categories[category] = []
+            # 优先使用预先计算的 _cat，未经扫描的文章字典回退到 metadata
+            category = post["_cat"] if "_cat" in post else post["metadata"].get("category", default_category)
             categories[category].append(post)
         
-        return categories
+        return dict(categories)
     
     def group_by_tags(self, posts: list[dict]) -> dict[str, list]:
         """按标签分组文章（一篇文章可以属于多个标签）
@@ -144,13 +349,11 @@ class FileScanner:
         Returns:
             dict[str, list]: 标签名到文章列表的映射
         """
-        tags = {}
+        tags = defaultdict(list)
         
         for post in posts:
-            post_tags = post["metadata"].get("tags", [])
-            for tag in post_tags:
-                if tag not in tags:
-                    tags[tag] = []
+            # 优先使用预先计算的 _tags，未经扫描的文章字典回退到 metadata
+            for tag in post.get("_tags") or post["metadata"].get("tags") or ():
                 tags[tag].append(post)
         
-        return tags
+        return dict(tags)
@@ -0,0 +1,138 @@
+"""页面写入器：后台线程写盘，或将整个站点打包为单个归档文件"""
+
+import os
+import queue
+import threading
+import zipfile
+from pathlib import Path
+from loguru import logger
+
+
+# 队列结束标记
+_STOP = object()
+
+# 覆盖写入的打开方式（Linux 上追加 O_CLOEXEC，避免文件描述符泄漏到子进程）
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+
+
+def write_file(path: Path, data: bytes):
+    """将字节内容覆盖写入文件
+    
+    直接使用 os.open / os.write，不经过 Path.write_bytes 创建的缓冲 IO 对象。
+    文件权限与 open() 一致（0o666，受 umask 约束）。
+    
+    Args:
+        path: 输出文件路径
+        data: 文件内容
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        # os.write 可能只写入部分内容，循环直到写完
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+class BackgroundWriter:
+    """由若干后台线程消费写入队列的文件写入器
+    
+    生成器渲染完页面后调用 write() 入队即可继续渲染下一页，
+    由后台线程负责实际写盘（写文件的系统调用会释放 GIL，多个线程可同时写入）。
+    构建结束时调用 close() 等待队列写完，写入过程中出现的异常会在 close() 时抛出。
+    """
+    
+    def __init__(self, workers: int = 8, max_pending: int = 256):
+        """初始化写入器并启动后台线程
+        
+        Args:
+            workers: 写入线程数
+            max_pending: 队列中允许积压的最大文件数（防止渲染过快时占用过多内存）
+        """
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._error: Exception | None = None
+        self._threads = [
+            threading.Thread(target=self._drain, name=f"iblog-writer-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for thread in self._threads:
+            thread.start()
+    
+    def write(self, path: Path, data: bytes):
+        """将文件写入任务加入队列
+        
+        Args:
+            path: 输出文件路径
+            data: 文件内容
+        """
+        self._queue.put((path, data))
+    
+    def close(self):
+        """等待队列中的文件全部写完
+        
+        Raises:
+            Exception: 后台写入时出现的异常（多个文件失败时只抛出其中一个）
+        """
+        # 每个线程各取一个结束标记后退出
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        if self._error is not None:
+            raise self._error
+    
+    def _drain(self):
+        """后台线程：从队列取出文件依次写出，直到收到结束标记"""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            path, data = item
+            try:
+                write_file(path, data)
+            except Exception as e:
+                logger.error(f"写入文件 {path} 失败: {e}")
+                if self._error is None:
+                    self._error = e
+
+
+class BundleWriter:
+    """将生成的页面收集在内存中，构建结束时一次性写入 site.zip
+    
+    适用于输出目录位于网络文件系统的场景：逐个写入上千个小文件受往返延迟限制，
+    打包后只需一次写入，部署时在目标端解压即可。
+    """
+    
+    def __init__(self, output_dir: Path, bundle_name: str = "site.zip"):
+        """初始化打包写入器
+        
+        Args:
+            output_dir: 输出根目录，归档内的路径相对于此目录
+            bundle_name: 归档文件名
+        """
+        self.output_dir = output_dir
+        self.bundle_path = output_dir / bundle_name
+        # (相对路径, 内容)；list.append 是原子操作，可被多个生成器线程同时调用
+        self._pages: list[tuple[str, bytes]] = []
+    
+    def write(self, path: Path, data: bytes):
+        """收集一个页面
+        
+        Args:
+            path: 输出文件路径（须位于输出根目录下）
+            data: 文件内容
+        """
+        self._pages.append((path.relative_to(self.output_dir).as_posix(), data))
+    
+    def close(self):
+        """将收集到的页面写入归档（不压缩，避免额外的 CPU 开销）"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(self.bundle_path, "w", zipfile.ZIP_STORED) as bundle:
+            for name, data in sorted(self._pages):
+                bundle.writestr(name, data)
+        logger.success(f"站点已打包: {self.bundle_path}（{len(self._pages)} 个文件）")
+
+
+# 生成器可使用的页面写入器
+PageWriter = BackgroundWriter | BundleWriter
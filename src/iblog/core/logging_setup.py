@@ -0,0 +1,44 @@
+"""日志配置：根据 config.logging 一次性配置 loguru 的输出"""
+
+import sys
+from loguru import logger
+
+from .config_models import LoggingConfig
+
+# 是否有日志输出接收 DEBUG 级别（未调用 setup_logging 时沿用 loguru 默认的 DEBUG 输出）
+_debug_enabled = True
+
+
+def setup_logging(logging_config: LoggingConfig):
+    """按配置重建 loguru 的日志输出
+    
+    低于配置级别的日志在 loguru 内部即被过滤，不会进行格式化。
+    
+    Args:
+        logging_config: 日志配置
+    """
+    global _debug_enabled
+    _debug_enabled = (logging_config.console or logging_config.file.enabled) and (
+        logger.level(logging_config.level).no <= logger.level("DEBUG").no
+    )
+    logger.remove()
+    if logging_config.console:
+        logger.add(sys.stderr, level=logging_config.level, format=logging_config.format)
+    if logging_config.file.enabled:
+        logger.add(
+            logging_config.file.path,
+            level=logging_config.level,
+            format=logging_config.format,
+            encoding="utf-8",
+        )
+
+
+def debug_enabled() -> bool:
+    """是否输出 DEBUG 日志
+    
+    供逐项循环中的调试日志提前判断，未开启 DEBUG 时连 logger.debug 的调用开销也一并省去。
+    
+    Returns:
+        bool: 是否输出 DEBUG 日志
+    """
+    return _debug_enabled
@@ -1,10 +1,131 @@
 """元数据解析器：统一的 Frontmatter 解析和验证逻辑"""
 
+import sys
+from functools import lru_cache
+import yaml
 from loguru import logger
-import frontmatter
 
 from .config_models import Config
 
+# 优先使用 libyaml 的 C 实现
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+def _is_delimiter(line: str | bytes, dash: str | bytes) -> bool:
+    """判断一行是否为 Frontmatter 分隔符（三个及以上的 -）"""
+    line = line.strip()
+    return len(line) >= 3 and not line.strip(dash)
+
+
+def _decode(data: str | bytes) -> str:
+    """将字节解码为 UTF-8 字符串（字符串原样返回）"""
+    return data.decode("utf-8") if isinstance(data, bytes) else data
+
+
+@lru_cache(maxsize=None)
+def _date_formatter(fmt: str):
+    """按格式字符串返回日期格式化函数，常用格式直接拼接数字，避免逐次调用 strftime"""
+    if fmt == "%Y-%m-%d":
+        return lambda d: f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+    if fmt == "%Y-%m-%d %H:%M":
+        return lambda d: (f"{d.year:04d}-{d.month:02d}-{d.day:02d} "
+                          f"{getattr(d, 'hour', 0):02d}:{getattr(d, 'minute', 0):02d}")
+    return lambda d: d.strftime(fmt)
+
+
+def format_date(value, fmt: str = "%Y-%m-%d") -> str:
+    """将 date/datetime 对象格式化为字符串
+    
+    Args:
+        value: date 或 datetime 对象
+        fmt: strftime 格式字符串
+        
+    Returns:
+        str: 格式化后的日期
+    """
+    return _date_formatter(fmt)(value)
+
+
+def _locate_frontmatter(text: str | bytes) -> tuple[int, int, int] | None:
+    """定位 Frontmatter 的位置（text 应已去除首尾空白）
+    
+    Args:
+        text: Markdown 内容
+        
+    Returns:
+        tuple[int, int, int] | None: (头部起点, 头部终点, 正文起点)；没有完整的 Frontmatter 时返回 None
+    """
+    nl, dash = ("\n", "-") if isinstance(text, str) else (b"\n", b"-")
+    
+    first_line_end = text.find(nl)
+    if not text.startswith(dash * 3) or first_line_end == -1 or not _is_delimiter(text[:first_line_end], dash):
+        return None
+    
+    # 查找结束分隔符
+    pos = first_line_end
+    while True:
+        pos = text.find(nl + dash * 3, pos)
+        if pos == -1:
+            return None
+        line_end = text.find(nl, pos + 1)
+        if line_end == -1:
+            line_end = len(text)
+        if _is_delimiter(text[pos + 1:line_end], dash):
+            return first_line_end + 1, pos, line_end + 1
+        pos = line_end
+
+
+def _load_header(header: str | bytes) -> dict:
+    """解析 YAML 头部，非字典结果视为空元数据"""
+    metadata = yaml.load(_decode(header), Loader=_YamlLoader)
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def split_frontmatter(md_content: str | bytes) -> tuple[dict, str]:
+    """拆分 YAML Frontmatter 和正文
+    
+    传入 bytes 时直接在字节上查找分隔符，只对头部和正文各解码一次。
+    
+    Args:
+        md_content: Markdown 文件内容（str 或 UTF-8 编码的 bytes）
+        
+    Returns:
+        tuple[dict, str]: (原始元数据字典, 正文内容)；没有 Frontmatter 时元数据为空字典
+        
+    Raises:
+        yaml.YAMLError: Frontmatter 不是合法的 YAML
+        UnicodeDecodeError: bytes 不是合法的 UTF-8
+    """
+    text = md_content.strip()
+    location = _locate_frontmatter(text)
+    if location is None:
+        return {}, _decode(text).strip()
+    
+    header_start, header_end, body_start = location
+    return _load_header(text[header_start:header_end]), _decode(text[body_start:]).strip()
+
+
+def peek_frontmatter(head: bytes) -> dict | None:
+    """只根据文件开头的一段字节解析 Frontmatter，不处理正文
+    
+    Args:
+        head: 文件开头的字节（可能截断在正文中间）
+        
+    Returns:
+        dict | None: 原始元数据字典；头部不完整或没有 Frontmatter 时返回 None
+        
+    Raises:
+        yaml.YAMLError: Frontmatter 不是合法的 YAML
+    """
+    text = head.lstrip()
+    location = _locate_frontmatter(text)
+    if location is None:
+        return None
+    return _load_header(text[location[0]:location[1]])
+
 
 class MetadataParser:
     """解析 Markdown 文件的 Frontmatter 元数据"""
@@ -21,33 +142,37 @@ class MetadataParser:
         self.default_tags = config.posts.defaults.tags
         self.default_author = config.posts.defaults.author or config.site.author
     
-    def parse(self, md_content: str) -> tuple[dict, str]:
+    def parse(self, md_content: str | bytes) -> tuple[dict, str]:
         """解析 Frontmatter，返回 (元数据, 正文)
         
         Args:
-            md_content: Markdown 文件内容
+            md_content: Markdown 文件内容（str 或 UTF-8 编码的 bytes）
             
         Returns:
             tuple[dict, str]: (元数据字典, 正文内容)
         """
         try:
-            post = frontmatter.loads(md_content)
-            metadata = self.validate_metadata(post.metadata)
-            return metadata, post.content
+            metadata, content = split_frontmatter(md_content)
+            return self.validate_metadata(metadata), content
+        except UnicodeDecodeError:
+            # 文件编码错误交由调用方处理
+            raise
         except Exception as e:
             logger.warning(f"解析 Frontmatter 失败: {e}")
-            return {}, md_content
+            return {}, _decode(md_content)
     
     def validate_metadata(self, metadata: dict) -> dict:
         """标准化元数据字段（设置默认值、规范化格式）
         
+        直接在传入的字典上修改（parse 传入的是新解析出的字典，无需复制）。
+        
         Args:
             metadata: 原始元数据字典
             
         Returns:
-            dict: 标准化后的元数据字典
+            dict: 标准化后的元数据字典（与传入的是同一个对象）
         """
-        validated = metadata.copy()
+        validated = metadata
         
         # 确保 title 存在
         if "title" not in validated:
@@ -68,6 +193,11 @@ class MetadataParser:
             # 使用配置中的默认分类
             validated["category"] = self.default_category
         
+        # 驻留分类和标签字符串：同名分类/标签在所有文章间共享同一对象，分组时哈希比较更快
+        if isinstance(validated["category"], str):
+            validated["category"] = sys.intern(validated["category"])
+        validated["tags"] = [sys.intern(tag) if isinstance(tag, str) else tag for tag in validated["tags"]]
+        
         # 确保 author 存在
         if "author" not in validated:
             validated["author"] = self.default_author
@@ -78,7 +208,7 @@ class MetadataParser:
         
         # 标准化日期格式（如果是 datetime 对象，转为字符串）
         if hasattr(validated["date"], "strftime"):
-            validated["date"] = validated["date"].strftime("%Y-%m-%d")
+            validated["date"] = format_date(validated["date"])
         
         # 确保 pinned 字段存在（用于置顶功能）
         if "pinned" not in validated:
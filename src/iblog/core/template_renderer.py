@@ -1,7 +1,8 @@
 """模板渲染器：封装 Jinja2 渲染逻辑"""
 
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from loguru import logger
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
 from .config_models import Config
 
@@ -18,7 +19,108 @@ class TemplateRenderer:
         """
         self.template_dir = Path(template_dir)
         self.config = config
-        self.env = Environment(loader=FileSystemLoader(str(self.template_dir)))
+        # 整个构建只创建一个 Environment，所有生成器共享其模板缓存
+        self.env = Environment(
+            loader=FileSystemLoader(str(self.template_dir)),
+            auto_reload=False,
+            cache_size=-1,  # 模板集合小且固定，不限制缓存大小
+            trim_blocks=True,
+            lstrip_blocks=True,
+            bytecode_cache=self._create_bytecode_cache(),
+        )
+        # 已编译模板缓存：模板名 -> Template，每个模板只经过一次加载器
+        self._template_cache: dict[str, Template] = {}
+        # 可选的 MiniJinja 渲染后端（未启用或未安装时为 None，使用 Jinja2）
+        self._minijinja = self._create_minijinja()
+        self._posts_dir = self.config.paths.output.posts
+        # 全局上下文只依赖只读的配置和页面层级，按层级预先计算一次
+        site = self.config.site.model_dump()
+        footer = self.config.footer.model_dump()
+        theme = self.config.theme.model_dump()
+        self._global_context_by_depth = {
+            depth: {
+                'site': site,
+                'footer': footer,
+                'theme': theme,
+                'navigation': self._get_nav_links(depth)
+            }
+            for depth in (0, 1)
+        }
+    
+    def _create_bytecode_cache(self) -> FileSystemBytecodeCache | None:
+        """启用增量构建时创建模板字节码缓存，后续构建可跳过模板编译
+        
+        Returns:
+            FileSystemBytecodeCache | None: 字节码缓存；未启用增量构建时返回 None
+        """
+        if not self.config.build.incremental:
+            return None
+        cache_dir = Path(self.config.build.cache_dir) / "jinja"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return FileSystemBytecodeCache(str(cache_dir))
+    
+    def _create_minijinja(self):
+        """按配置创建 MiniJinja 环境（Rust 实现的 Jinja 方言，渲染更快）
+        
+        Returns:
+            minijinja.Environment | None: MiniJinja 环境；未启用或未安装时返回 None
+        """
+        if self.config.build.template_engine != "minijinja":
+            return None
+        try:
+            import minijinja
+        except ImportError:
+            logger.warning("未安装 minijinja，回退到 Jinja2 渲染（可通过 pip install iblog[minijinja] 安装）")
+            return None
+        
+        def load(name: str) -> str | None:
+            path = self.template_dir / name
+            return path.read_text(encoding="utf-8") if path.is_file() else None
+        
+        # 与 Jinja2 环境保持一致：不自动转义，去除块标签带来的空白
+        return minijinja.Environment(
+            loader=load,
+            auto_escape_callback=lambda name: False,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+    
+    def precompile(self):
+        """预先编译模板目录下的所有模板
+        
+        启用字节码缓存时会同时写入缓存，之后的构建（以及并行构建的工作进程）可直接加载字节码。
+        """
+        for template_name in self.env.list_templates(extensions=["html"]):
+            self._get_template(template_name)
+    
+    def _get_template(self, template_name: str) -> Template:
+        """获取已编译的模板，首次访问后缓存在实例上
+        
+        Args:
+            template_name: 模板文件名
+            
+        Returns:
+            Template: 编译后的模板
+        """
+        template = self._template_cache.get(template_name)
+        if template is None:
+            template = self._template_cache[template_name] = self.env.get_template(template_name)
+        return template
+    
+    def _render(self, template_name: str, context: dict) -> str:
+        """渲染模板
+        
+        Args:
+            template_name: 模板文件名
+            context: 模板上下文
+            
+        Returns:
+            str: 渲染结果
+        """
+        if self._minijinja is not None:
+            return self._minijinja.render_template(template_name, **context)
+        # 直接传入上下文字典：Template.render 内部只复制一次，避免 ** 解包再打包
+        return self._get_template(template_name).render(context)
     
     def _get_nav_links(self, depth: int) -> list[dict]:
         """根据页面层级生成导航链接（从配置或使用默认导航）
@@ -82,6 +184,17 @@ class TemplateRenderer:
         
         return breadcrumb
     
+    def _subdir_url(self, post: dict) -> str:
+        """获取从一级子目录页面指向博文的相对链接
+        
+        Args:
+            post: 文章字典
+            
+        Returns:
+            str: 博文链接
+        """
+        return post.get("_subdir_url") or f"../{self._posts_dir}/{post['file_path'].stem}.html"
+    
     def _get_global_context(self, depth: int) -> dict:
         """获取所有模板共享的全局上下文
         
@@ -89,14 +202,9 @@ class TemplateRenderer:
             depth: 页面层级，用于生成导航链接
             
         Returns:
-            dict: 全局上下文，包含 site, footer, theme, navigation
+            dict: 全局上下文（预先计算结果的浅拷贝，调用方可直接 update），包含 site, footer, theme, navigation
         """
-        return {
-            'site': self.config.site.model_dump(),
-            'footer': self.config.footer.model_dump(),
-            'theme': self.config.theme.model_dump(),
-            'navigation': self._get_nav_links(depth)
-        }
+        return self._global_context_by_depth[depth].copy()
     
     def render_post(self, content_html: str, metadata: dict, total_posts: int = 0, toc: list = None) -> str:
         """渲染单篇博文页面
@@ -110,7 +218,6 @@ class TemplateRenderer:
         Returns:
             str: 完整的 HTML 页面
         """
-        template = self.env.get_template("blog_post.html")
         # 合并全局上下文和页面特定数据
         context = self._get_global_context(depth=1)
         context.update({
@@ -120,7 +227,7 @@ class TemplateRenderer:
             'total_posts': total_posts,
             'toc': toc or []
         })
-        return template.render(**context)
+        return self._render("blog_post.html", context)
     
     def render_index(self, posts: list[dict], total_posts: int = 0) -> str:
         """渲染首页
@@ -132,7 +239,6 @@ class TemplateRenderer:
         Returns:
             str: 首页 HTML 内容
         """
-        template = self.env.get_template("index.html")
         # 提取所有文章的 metadata
         posts_metadata = [post["metadata"] for post in posts]
         # 合并全局上下文
@@ -141,7 +247,7 @@ class TemplateRenderer:
             'posts': posts_metadata,
             'total_posts': total_posts
         })
-        return template.render(**context)
+        return self._render("index.html", context)
     
     def render_categories(self, categories: list[dict], total_posts: int = 0) -> str:
         """渲染分类汇总页
@@ -157,13 +263,12 @@ class TemplateRenderer:
         Returns:
             str: 分类汇总页 HTML 内容
         """
-        template = self.env.get_template("categories.html")
         context = self._get_global_context(depth=1)
         context.update({
             'categories': categories,
             'total_posts': total_posts
         })
-        return template.render(**context)
+        return self._render("categories.html", context)
     
     def render_category_detail(self, category_name: str, posts: list[dict], total_posts: int = 0) -> str:
         """渲染单个分类的详情页
@@ -176,14 +281,8 @@ class TemplateRenderer:
         Returns:
             str: 分类详情页 HTML 内容
         """
-        template = self.env.get_template("category_detail.html")
-        # 为文章添加相对 URL（使用配置的路径）
-        posts_dir = self.config.paths.output.posts
-        posts_with_url = []
-        for post in posts:
-            metadata = post["metadata"].copy()
-            metadata["url"] = f"../{posts_dir}/{post['file_path'].stem}.html"
-            posts_with_url.append(metadata)
+        # 为文章添加相对 URL（优先使用扫描时预先计算的链接）
+        posts_with_url = [{**post["metadata"], "url": self._subdir_url(post)} for post in posts]
         
         context = self._get_global_context(depth=1)
         context.update({
@@ -192,20 +291,7 @@ class TemplateRenderer:
             'breadcrumb': self._get_breadcrumb_links("categories"),
             'total_posts': total_posts
         })
-        return template.render(**context)
-    
-    def render_category_page(self, category: str, posts: list) -> str:
-        """渲染分类页面（已弃用，使用 render_category_detail）
-        
-        Args:
-            category: 分类名称
-            posts: 该分类下的文章列表
-            
-        Returns:
-            str: 分类页面 HTML 内容
-        """
-        # 为了向后兼容，调用新方法
-        return self.render_category_detail(category, posts)
+        return self._render("category_detail.html", context)
     
     def render_tags(self, tags: list[dict], total_posts: int = 0) -> str:
         """渲染标签云索引页
@@ -221,13 +307,12 @@ class TemplateRenderer:
         Returns:
             str: 标签云页面 HTML 内容
         """
-        template = self.env.get_template("tags.html")
         context = self._get_global_context(depth=1)
         context.update({
             'tags': tags,
             'total_posts': total_posts
         })
-        return template.render(**context)
+        return self._render("tags.html", context)
     
     def render_tag_detail(self, tag_name: str, posts: list[dict], total_posts: int = 0) -> str:
         """渲染单个标签的详情页
@@ -240,14 +325,8 @@ class TemplateRenderer:
         Returns:
             str: 标签详情页 HTML 内容
         """
-        template = self.env.get_template("tag_detail.html")
-        # 为文章添加相对 URL（使用配置的路径）
-        posts_dir = self.config.paths.output.posts
-        posts_with_url = []
-        for post in posts:
-            metadata = post["metadata"].copy()
-            metadata["url"] = f"../{posts_dir}/{post['file_path'].stem}.html"
-            posts_with_url.append(metadata)
+        # 为文章添加相对 URL（优先使用扫描时预先计算的链接）
+        posts_with_url = [{**post["metadata"], "url": self._subdir_url(post)} for post in posts]
         
         context = self._get_global_context(depth=1)
         context.update({
@@ -256,20 +335,7 @@ class TemplateRenderer:
             'breadcrumb': self._get_breadcrumb_links("tags"),
             'total_posts': total_posts
         })
-        return template.render(**context)
-    
-    def render_tag_page(self, tag: str, posts: list) -> str:
-        """渲染标签页面（已弃用，使用 render_tag_detail）
-        
-        Args:
-            tag: 标签名称
-            posts: 该标签下的文章列表
-            
-        Returns:
-            str: 标签页面 HTML 内容
-        """
-        # 为了向后兼容，调用新方法
-        return self.render_tag_detail(tag, posts)
+        return self._render("tag_detail.html", context)
     
     def render_about(self, content_html: str, metadata: dict, total_posts: int = 0) -> str:
         """渲染关于页面
@@ -282,11 +348,10 @@ class TemplateRenderer:
         Returns:
             str: 完整的 HTML 页面
         """
-        template = self.env.get_template("about.html")
         context = self._get_global_context(depth=1)
         context.update({
             'title': metadata.get("title", "关于"),
             'content_html': content_html,
             'total_posts': total_posts
         })
-        return template.render(**context)
+        return self._render("about.html", context)
@@ -1,9 +1,32 @@
 """目录（TOC）生成器：从HTML内容中提取标题生成目录"""
 
 import re
-from html.parser import HTMLParser
+from functools import lru_cache
+from html import unescape
 from typing import List, Dict
 
+# 匹配完整的标题元素：标签名、属性、内部 HTML
+_HEADING_RE = re.compile(r'<(h[1-6])(\s[^>]*)?>(.*?)</\1\s*>', re.IGNORECASE | re.DOTALL)
+# 标题内部的行内标签（如 <code>、<a>）
+_TAG_RE = re.compile(r'<[^>]+>')
+# 标题上已有的 id 属性
+_ID_ATTR_RE = re.compile(r'''\bid\s*=\s*["']([^"']*)["']''', re.IGNORECASE)
+# 生成 ID 时去除的特殊字符，以及替换为连字符的空白
+_NONWORD_RE = re.compile(r'[^\w\s-]')
+_WS_RE = re.compile(r'[\s_]+')
+
+# 目录与标题 ID 的输出格式版本，修改生成规则时递增，使缓存的渲染结果失效
+TOC_FORMAT_VERSION = 2
+
+
+@lru_cache(maxsize=4096)
+def _slugify(text: str) -> str:
+    """将标题文本转换为基础 ID（纯函数，跨文档缓存常见标题）"""
+    # 转换为小写，替换空格和特殊字符
+    base_id = _WS_RE.sub('-', _NONWORD_RE.sub('', text.lower())).strip('-')
+    # 如果为空，使用默认值
+    return base_id or 'heading'
+
 
 class TocItem:
     """目录项数据类"""
@@ -14,51 +37,47 @@ class TocItem:
         self.id = id
 
 
-class TocExtractor(HTMLParser):
-    """HTML标题提取器"""
+class TocExtractor:
+    """HTML标题提取器（使用预编译正则单遍扫描，不逐字符解析整个文档）"""
     
     def __init__(self):
-        super().__init__()
         self.toc_items: List[TocItem] = []
-        self.current_tag = None
-        self.current_text = []
         self.heading_counter = {}  # 用于生成唯一ID
     
-    def handle_starttag(self, tag, attrs):
-        """处理开始标签"""
-        if tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            self.current_tag = tag
-            self.current_text = []
+    def feed(self, html_content: str):
+        """提取 HTML 中的所有标题"""
+        for match in _HEADING_RE.finditer(html_content):
+            self._handle_heading(match)
     
-    def handle_data(self, data):
-        """处理文本数据"""
-        if self.current_tag:
-            self.current_text.append(data)
+    def sub(self, html_content: str) -> str:
+        """提取所有标题，并为没有 ID 的标题添加 ID 属性"""
+        return _HEADING_RE.sub(self._add_id, html_content)
     
-    def handle_endtag(self, tag):
-        """处理结束标签"""
-        if tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6'] and self.current_tag == tag:
-            level = int(tag[1])
-            text = ''.join(self.current_text).strip()
-            
-            if text:
-                # 生成唯一ID
-                heading_id = self._generate_id(text)
-                self.toc_items.append(TocItem(level, text, heading_id))
-            
-            self.current_tag = None
-            self.current_text = []
+    def _handle_heading(self, match: re.Match) -> TocItem | None:
+        """处理一个标题元素，返回对应的目录项（标题文本为空时返回 None）"""
+        tag, attrs, inner = match.group(1), match.group(2) or '', match.group(3)
+        text = unescape(_TAG_RE.sub('', inner)).strip()
+        if not text:
+            return None
+        
+        # 已有 ID 的标题沿用原 ID，保证目录链接可用
+        existing_id = _ID_ATTR_RE.search(attrs)
+        heading_id = existing_id.group(1) if existing_id else self._generate_id(text)
+        item = TocItem(int(tag[1]), text, heading_id)
+        self.toc_items.append(item)
+        return item
+    
+    def _add_id(self, match: re.Match) -> str:
+        """re.sub 回调：记录目录项，并返回添加了 ID 的标题"""
+        item = self._handle_heading(match)
+        if item is None or _ID_ATTR_RE.search(match.group(2) or ''):
+            return match.group(0)
+        tag, attrs, inner = match.group(1), match.group(2) or '', match.group(3)
+        return f'<{tag} id="{item.id}"{attrs}>{inner}</{tag}>'
     
     def _generate_id(self, text: str) -> str:
         """从标题文本生成唯一ID"""
-        # 转换为小写，替换空格和特殊字符
-        base_id = re.sub(r'[^\w\s-]', '', text.lower())
-        base_id = re.sub(r'[\s_]+', '-', base_id)
-        base_id = base_id.strip('-')
-        
-        # 如果为空，使用默认值
-        if not base_id:
-            base_id = 'heading'
+        base_id = _slugify(text)
         
         # 确保唯一性
         if base_id not in self.heading_counter:
@@ -73,46 +92,54 @@ class TocGenerator:
     """目录生成器"""
     
     @staticmethod
-    def extract_toc(html_content: str) -> List[Dict]:
-        """从HTML内容中提取目录
+    def process(html_content: str) -> tuple[str, List[Dict]]:
+        """单遍完成目录提取和标题 ID 注入
         
         Args:
             html_content: HTML内容
             
         Returns:
-            目录项列表，每项包含 level, text, id
+            tuple[str, List[Dict]]: (添加了ID的HTML内容, 目录项列表)
         """
         extractor = TocExtractor()
-        extractor.feed(html_content)
-        
+        html = extractor.sub(html_content)
+        return html, TocGenerator._to_dicts(extractor.toc_items)
+    
+    @staticmethod
+    def _to_dicts(toc_items: List[TocItem]) -> List[Dict]:
+        """将目录项转换为模板使用的字典列表"""
         return [
             {
                 'level': item.level,
                 'text': item.text,
                 'id': item.id
             }
-            for item in extractor.toc_items
+            for item in toc_items
         ]
     
     @staticmethod
-    def add_heading_ids(html_content: str) -> str:
-        """为HTML中的标题添加ID属性
+    def extract_toc(html_content: str) -> List[Dict]:
+        """从HTML内容中提取目录
         
         Args:
             html_content: HTML内容
             
         Returns:
-            添加了ID的HTML内容
+            目录项列表，每项包含 level, text, id
         """
         extractor = TocExtractor()
         extractor.feed(html_content)
+        return TocGenerator._to_dicts(extractor.toc_items)
+    
+    @staticmethod
+    def add_heading_ids(html_content: str) -> str:
+        """为HTML中的标题添加ID属性
         
-        # 为每个标题添加ID
-        result = html_content
-        for item in extractor.toc_items:
-            # 匹配标题标签，并添加ID
-            pattern = rf'(<h{item.level})(>.*?{re.escape(item.text)}.*?</h{item.level}>)'
-            replacement = rf'\1 id="{item.id}"\2'
-            result = re.sub(pattern, replacement, result, count=1)
-        
-        return result
+        Args:
+            html_content: HTML内容
+            
+        Returns:
+            添加了ID的HTML内容
+        """
+        # 单遍替换：每个标题只处理一次
+        return TocExtractor().sub(html_content)
@@ -1,15 +1,23 @@
-"""生成器层模块：各种页面生成器"""
-
-from .base_generator import BaseGenerator
-from .post_generator import PostGenerator
-from .index_generator import IndexGenerator
-from .category_generator import CategoryGenerator
-from .tag_generator import TagGenerator
-
-__all__ = [
-    "BaseGenerator",
-    "PostGenerator",
-    "IndexGenerator",
-    "CategoryGenerator",
-    "TagGenerator",
-]
+"""生成器层模块：各种页面生成器
+
+子模块在首次访问时才导入，导入单个生成器不会连带加载其他生成器。
+"""
+
+from importlib import import_module
+
+_EXPORTS = {
+    "BaseGenerator": ".base_generator",
+    "PostGenerator": ".post_generator",
+    "IndexGenerator": ".index_generator",
+    "CategoryGenerator": ".category_generator",
+    "TagGenerator": ".tag_generator",
+    "ensure_output_dirs": ".base_generator",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
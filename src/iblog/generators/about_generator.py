@@ -2,14 +2,33 @@
 
 from pathlib import Path
 from loguru import logger
-import frontmatter
 
-from .base_generator import BaseGenerator
+from .base_generator import BaseGenerator, _RENDER_CACHE_SIGNATURE
+from iblog.core.build_cache import load_cache, save_cache
+from iblog.core.config_models import Config
+from iblog.core.file_writer import PageWriter
+from iblog.core.template_renderer import TemplateRenderer
+from iblog.core.metadata_parser import split_frontmatter
 
 
 class AboutGenerator(BaseGenerator):
     """生成关于页面的 HTML 文件"""
     
+    def __init__(self, renderer: TemplateRenderer, config: Config, writer: PageWriter | None = None):
+        """初始化关于页面生成器
+        
+        Args:
+            renderer: 模板渲染器实例
+            config: 配置对象
+            writer: 页面写入器（可选）
+        """
+        super().__init__(renderer, config, writer)
+        # 解析结果缓存：((绝对路径, mtime_ns, size), metadata, content_html)；启用增量构建时同时持久化到缓存目录
+        self._cache_path = Path(self.config.build.cache_dir) / "about.pkl"
+        self._about_cache: tuple[tuple[str, int, int], dict, str] | None = None
+        if self.config.build.incremental:
+            self._about_cache = load_cache(self._cache_path, _RENDER_CACHE_SIGNATURE)
+    
     def generate(self, about_file: Path, output_dir: Path, total_posts: int = 0):
         """生成关于页面的 HTML 文件
         
@@ -18,29 +37,13 @@ class AboutGenerator(BaseGenerator):
             output_dir: 输出根目录
             total_posts: 博客总数
         """
-        about_file = Path(about_file)
-        output_dir = Path(output_dir)
         # 使用配置的输出路径
         about_dir = output_dir / self.config.paths.output.about
-        about_dir.mkdir(parents=True, exist_ok=True)
         
         logger.info(f"开始生成关于页面，输出目录: {about_dir}")
         
         try:
-            # 读取并解析 about.md
-            with open(about_file, "r", encoding="utf-8") as f:
-                post = frontmatter.load(f)
-            
-            # 提取元数据和内容
-            metadata = dict(post.metadata)
-            content = post.content
-            
-            # 确保至少有 title
-            if "title" not in metadata:
-                metadata["title"] = "关于"
-            
-            # 将 Markdown 正文转换为 HTML
-            content_html = self.md_parser.render(content)
+            metadata, content_html = self._parse(about_file)
             
             # 使用模板渲染完整页面
             html = self.renderer.render_about(content_html, metadata, total_posts=total_posts)
@@ -49,7 +52,7 @@ class AboutGenerator(BaseGenerator):
             output_path = about_dir / "index.html"
             
             # 写入文件
-            output_path.write_text(html, encoding="utf-8")
+            self._write_html(output_path, html)
             
             logger.success(f"关于页面生成完成: {output_path}")
             
@@ -59,3 +62,32 @@ class AboutGenerator(BaseGenerator):
         except Exception as e:
             logger.error(f"生成关于页面失败: {e}")
             raise
+    
+    def _parse(self, about_file: Path) -> tuple[dict, str]:
+        """读取并解析 about.md；文件路径、mtime 和 size 均与缓存一致时直接复用上次结果
+        
+        Args:
+            about_file: about.md 文件路径
+            
+        Returns:
+            tuple[dict, str]: (元数据, 正文 HTML)
+        """
+        st = about_file.stat()
+        key = (str(about_file.resolve()), st.st_mtime_ns, st.st_size)
+        if self._about_cache is not None and self._about_cache[0] == key:
+            logger.debug("about.md 未修改，复用缓存的解析结果")
+            return self._about_cache[1], self._about_cache[2]
+        
+        metadata, content = split_frontmatter(about_file.read_bytes())
+        
+        # 确保至少有 title
+        if "title" not in metadata:
+            metadata["title"] = "关于"
+        
+        # 将 Markdown 正文转换为 HTML
+        content_html = self.md_parser.render(content)
+        
+        self._about_cache = (key, metadata, content_html)
+        if self.config.build.incremental:
+            save_cache(self._cache_path, self._about_cache, _RENDER_CACHE_SIGNATURE)
+        return metadata, content_html
@@ -1,25 +1,121 @@
 """基础生成器：所有生成器的抽象基类"""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Iterable
+import markdown_it
 from markdown_it import MarkdownIt
 
+from iblog import __version__
 from iblog.core.template_renderer import TemplateRenderer
 from iblog.core.config_models import Config
+from iblog.core.file_writer import PageWriter, write_file
+from iblog.core.logging_setup import debug_enabled
+from iblog.core.toc_generator import TOC_FORMAT_VERSION
+
+# 所有生成器共享的 Markdown 解析器（渲染时不修改解析器状态）
+_MD_PARSER = MarkdownIt("gfm-like")
+
+# 持久化的正文渲染结果（博文、关于页面）的缓存签名：iblog、Markdown 渲染器或目录格式的版本变化时缓存失效
+_RENDER_CACHE_SIGNATURE = {
+    "iblog": __version__,
+    "markdown_it": markdown_it.__version__,
+    "toc_format": TOC_FORMAT_VERSION,
+}
+
+
+def _post_date(post: dict):
+    """取文章的发布日期作为排序键
+    
+    优先使用 FileScanner 预先计算的 _date，其余来源的文章字典回退到 metadata。
+    
+    Args:
+        post: 文章字典
+        
+    Returns:
+        发布日期（缺失时为空字符串）
+    """
+    return post.get("_date") or post["metadata"].get("date", "")
+
+
+def _post_tags(post: dict):
+    """取文章的标签列表
+    
+    优先使用 FileScanner 预先计算的 _tags，其余来源的文章字典回退到 metadata。
+    
+    Args:
+        post: 文章字典
+        
+    Returns:
+        标签列表（缺失时为空元组）
+    """
+    return post.get("_tags") or post["metadata"].get("tags") or ()
+
+
+def ensure_output_dirs(output_dir: Path, subdirs: Iterable[str]):
+    """构建开始前一次性创建输出根目录和各生成器的输出子目录
+    
+    生成器本身不再创建目录，单独使用生成器时需先调用本函数。
+    
+    Args:
+        output_dir: 输出根目录
+        subdirs: 相对输出根目录的子目录（如 blogs、tags）
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    for subdir in subdirs:
+        os.makedirs(output_dir / subdir, exist_ok=True)
 
 
 class BaseGenerator:
     """生成器基类，定义统一接口"""
     
-    def __init__(self, renderer: TemplateRenderer, config: Config):
+    def __init__(self, renderer: TemplateRenderer, config: Config, writer: PageWriter | None = None):
         """初始化生成器
         
         Args:
             renderer: 模板渲染器实例
             config: 配置对象
+            writer: 页面写入器（可选），提供时页面交由其写出（后台写盘或打包）
         """
         self.renderer = renderer
         self.config = config
-        self.md_parser = MarkdownIt("gfm-like")
+        self.writer = writer
+        # 逐页调试日志的开关（日志在生成器创建前已按配置设置好）
+        self._debug = debug_enabled()
+        self.md_parser = _MD_PARSER
+    
+    def _write_html(self, path: Path, html: str):
+        """以 UTF-8 字节写入 HTML 文件（一次性编码，绕过文本 IO 层的换行转换）
+        
+        配置了页面写入器时交由写入器处理（后台线程写盘或收集到归档）。
+        
+        Args:
+            path: 输出文件路径
+            html: HTML 内容
+        """
+        data = html.encode("utf-8")
+        if self.writer is not None:
+            self.writer.write(path, data)
+        else:
+            write_file(path, data)
+    
+    def _run_all(self, func: Callable, items: Iterable):
+        """对每个元素执行 func；启用 build.parallel 时使用线程池并发执行
+        
+        Args:
+            func: 处理单个元素的函数
+            items: 待处理的元素
+        """
+        if not self.config.build.parallel:
+            for item in items:
+                func(item)
+            return
+        
+        max_workers = self.config.build.max_workers or min(os.cpu_count() or 1, 16)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # 消费迭代结果，使任务中的异常在此抛出
+            list(executor.map(func, items))
     
     def generate(self, posts: list[dict], output_dir: Path):
         """生成器的核心方法
@@ -1,9 +1,10 @@
 """分类生成器：生成按分类组织的文章视图（占位）"""
 
+from collections import defaultdict
 from pathlib import Path
 from loguru import logger
 
-from .base_generator import BaseGenerator
+from .base_generator import BaseGenerator, _post_date
 
 
 class CategoryGenerator(BaseGenerator):
@@ -22,10 +23,8 @@ class CategoryGenerator(BaseGenerator):
             posts: 文章列表
             output_dir: 输出根目录
         """
-        output_dir = Path(output_dir)
         # 使用配置的输出路径
         categories_dir = output_dir / self.config.paths.output.categories
-        categories_dir.mkdir(parents=True, exist_ok=True)
         
         logger.info("开始生成分类视图")
         
@@ -54,9 +53,11 @@ class CategoryGenerator(BaseGenerator):
         # 3. 生成分类汇总页
         self._render_category_index(category_stats, categories_dir, total_posts=len(posts))
         
-        # 4. 为每个分类生成详情页
-        for name, cat_posts in categories_dict.items():
-            self._render_category_detail(name, cat_posts, categories_dir, total_posts=len(posts))
+        # 4. 为每个分类生成详情页（启用并行构建时并发渲染）
+        self._run_all(
+            lambda item: self._render_category_detail(item[0], item[1], categories_dir, total_posts=len(posts)),
+            categories_dict.items(),
+        )
         
         logger.success(f"分类视图生成完成，共 {len(categories_dict)} 个分类")
     
@@ -69,16 +70,16 @@ class CategoryGenerator(BaseGenerator):
         Returns:
             dict[str, list]: 分类名到文章列表的映射
         """
-        categories = {}
+        categories = defaultdict(list)
+        # 使用配置的默认分类
+        default_category = self.config.posts.defaults.category
         
         for post in posts:
-            # 使用配置的默认分类
-            category = post["metadata"].get("category", self.config.posts.defaults.category)
-            if category not in categories:
-                categories[category] = []
+            # 优先使用 FileScanner 预先计算的 _cat，手工构造的文章字典回退到 metadata
+            category = post["_cat"] if "_cat" in post else post["metadata"].get("category", default_category)
             categories[category].append(post)
         
-        return categories
+        return dict(categories)
     
     def _get_latest_post(self, posts: list[dict]) -> dict:
         """获取该分类最新的文章
@@ -92,14 +93,8 @@ class CategoryGenerator(BaseGenerator):
         if not posts:
             return None
         
-        # 按日期排序，取最新的
-        sorted_posts = sorted(
-            posts,
-            key=lambda p: p["metadata"].get("date", ""),
-            reverse=True
-        )
-        
-        latest = sorted_posts[0]["metadata"]
+        # 取日期最新的一篇，无需整体排序
+        latest = max(posts, key=_post_date)["metadata"]
         return {
             'title': latest.get('title', '无标题'),
             'date': latest.get('date', '')
@@ -116,7 +111,7 @@ class CategoryGenerator(BaseGenerator):
         html = self.renderer.render_categories(category_stats, total_posts=total_posts)
         
         index_path = categories_dir / "index.html"
-        index_path.write_text(html, encoding="utf-8")
+        self._write_html(index_path, html)
         
         logger.success(f"分类汇总页已生成: {index_path}")
     
@@ -130,16 +125,13 @@ class CategoryGenerator(BaseGenerator):
             total_posts: 博客总数
         """
         # 按日期排序（最新的在前）
-        sorted_posts = sorted(
-            posts,
-            key=lambda p: p["metadata"].get("date", ""),
-            reverse=True
-        )
+        sorted_posts = sorted(posts, key=_post_date, reverse=True)
         
         html = self.renderer.render_category_detail(category_name, sorted_posts, total_posts=total_posts)
         
         # 生成文件名
         output_path = categories_dir / f"{category_name}.html"
-        output_path.write_text(html, encoding="utf-8")
+        self._write_html(output_path, html)
         
-        logger.debug(f"已生成分类页: {category_name} ({len(posts)} 篇文章)")
+        if self._debug:
+            logger.debug("已生成分类页: {} ({} 篇文章)", category_name, len(posts))
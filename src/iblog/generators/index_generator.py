@@ -16,23 +16,23 @@ class IndexGenerator(BaseGenerator):
             posts: 文章列表（应已按日期排序）
             output_dir: 输出根目录
         """
-        output_dir = Path(output_dir)
-        
         logger.info("开始生成首页")
         
-        # 为每篇文章添加相对 URL（使用配置的路径）
+        # 为每篇文章添加相对 URL（优先使用扫描时预先计算的链接，否则按配置的路径生成）
         posts_dir = self.config.paths.output.posts
-        posts_with_url = []
-        for post in posts:
-            metadata = post["metadata"].copy()
-            metadata["url"] = f"{posts_dir}/{post['file_path'].stem}.html"
-            posts_with_url.append({"metadata": metadata})
+        posts_with_url = [
+            {"metadata": {
+                **post["metadata"],
+                "url": post.get("_url") or f"{posts_dir}/{post['file_path'].stem}.html",
+            }}
+            for post in posts
+        ]
         
         # 渲染首页
         html = self.renderer.render_index(posts_with_url, total_posts=len(posts))
         
         # 写入文件
         index_path = output_dir / "index.html"
-        index_path.write_text(html, encoding="utf-8")
+        self._write_html(index_path, html)
         
         logger.success(f"首页已生成: {index_path}")
@@ -1,59 +1,295 @@
 """博文生成器：将 Markdown 文件转换为 HTML 博文页面"""
 
+import hashlib
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from loguru import logger
 
-from .base_generator import BaseGenerator
+from .base_generator import BaseGenerator, _RENDER_CACHE_SIGNATURE
+from iblog.core.build_cache import load_cache, save_cache
+from iblog.core.config_models import Config
+from iblog.core.file_writer import PageWriter
+from iblog.core.logging_setup import setup_logging
+from iblog.core.template_renderer import TemplateRenderer
 from iblog.core.toc_generator import TocGenerator
 
 
+# 博文少于此数量时串行生成：启动进程池并在每个进程中重建渲染器的开销会超过并行收益
+_PARALLEL_MIN_POSTS = 8
+
+# 跳过未修改博文时比对的构建戳文件名（位于缓存目录）
+_STAMP_FILE = "posts_stamp.pkl"
+
+# 工作进程内的生成器实例（由 _init_worker 创建）
+_worker_generator = None
+
+
+class _PageCollector:
+    """工作进程内的页面收集器：主进程配置了页面写入器时，渲染结果回传给主进程写出"""
+    
+    def __init__(self):
+        self.pages: list[tuple[Path, bytes]] = []
+    
+    def write(self, path: Path, data: bytes):
+        self.pages.append((path, data))
+
+
+def _init_worker(generator_cls: type, template_dir: Path, config: Config, collect: bool):
+    """工作进程初始化：每个进程只创建一次渲染器和生成器"""
+    global _worker_generator
+    setup_logging(config.logging)
+    writer = _PageCollector() if collect else None
+    _worker_generator = generator_cls(TemplateRenderer(template_dir, config), config, writer)
+
+
+def _content_key(content: str) -> bytes:
+    """计算正文摘要，作为渲染缓存的键"""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+def _write_chunk(
+    posts: list[dict], blogs_dir: Path, total_posts: int, skip_unchanged: bool
+) -> tuple[int, list[tuple[Path, bytes]], dict]:
+    """在工作进程中生成一批博文，返回成功数量、需由主进程写出的页面和本批的正文渲染结果"""
+    _worker_generator._skip_unchanged = skip_unchanged
+    seen = len(_worker_generator._rendered)
+    write_one = _worker_generator.write_one
+    count = sum(write_one(post, blogs_dir, total_posts) for post in posts)
+    # 只回传本批新增的渲染结果（字典按插入顺序排列），供主进程写回增量缓存
+    rendered = {}
+    if _worker_generator.config.build.incremental:
+        rendered = dict(itertools.islice(_worker_generator._rendered.items(), seen, None))
+    collector = _worker_generator.writer
+    if collector is None:
+        return count, [], rendered
+    pages, collector.pages = collector.pages, []
+    return count, pages, rendered
+
+
 class PostGenerator(BaseGenerator):
     """生成所有博文的 HTML 文件"""
     
+    def __init__(self, renderer: TemplateRenderer, config: Config, writer: PageWriter | None = None):
+        """初始化博文生成器
+        
+        Args:
+            renderer: 模板渲染器实例
+            config: 配置对象
+            writer: 页面写入器（可选）
+        """
+        super().__init__(renderer, config, writer)
+        # 正文渲染缓存：正文摘要 -> (添加了标题ID的正文 HTML, 目录)；启用增量构建时跨构建复用
+        self._cache_path = Path(self.config.build.cache_dir) / "render.pkl"
+        self._render_cache: dict[bytes, tuple[str, list]] = {}
+        if self.config.build.incremental:
+            self._render_cache = load_cache(self._cache_path, _RENDER_CACHE_SIGNATURE) or {}
+        # 本次构建产生或复用的渲染结果：用于构建内去重，启用增量构建时在结束时写回缓存（不再出现的正文随之清理）
+        self._rendered: dict[bytes, tuple[str, list]] = {}
+        # 是否跳过输出文件比源文件新的博文（由 generate 根据构建戳决定）
+        self._skip_unchanged = False
+    
     def generate(self, posts: list[dict], output_dir: Path):
         """生成所有博文的 HTML 文件
         
+        启用 build.parallel 时，博文按批分发到多个进程并行渲染（输出文件互不相同，由各进程直接写入；
+        配置了页面写入器时，渲染结果回传主进程交由写入器处理）。
+        
         Args:
             posts: 文章列表（包含 file_path, metadata, content）
             output_dir: 输出根目录
         """
-        output_dir = Path(output_dir)
         # 使用配置的输出路径
         blogs_dir = output_dir / self.config.paths.output.posts
-        blogs_dir.mkdir(parents=True, exist_ok=True)
         
         logger.info(f"开始生成博文，输出目录: {blogs_dir}")
         
-        converted_count = 0
-        for post in posts:
-            try:
-                # 将 Markdown 正文转换为 HTML
-                content_html = self.md_parser.render(post["content"])
-                
-                # 提取目录（TOC）
-                toc = TocGenerator.extract_toc(content_html)
-                
-                # 为标题添加ID以支持锚点跳转
-                content_html = TocGenerator.add_heading_ids(content_html)
-                
-                # 使用模板渲染完整页面
-                html = self.renderer.render_post(
-                    content_html, 
-                    post["metadata"], 
-                    total_posts=len(posts),
-                    toc=toc
-                )
-                
-                # 生成输出文件路径
-                output_path = blogs_dir / post["file_path"].with_suffix(".html").name
-                
-                # 写入文件
-                output_path.write_text(html, encoding="utf-8")
-                
-                converted_count += 1
-                logger.debug(f"已生成: {output_path.name}")
-            except Exception as e:
-                logger.error(f"生成博文 {post['file_path'].name} 失败: {e}")
-                continue
+        # 增量构建时，若影响所有博文页面的因素（模板、配置、文章总数等）与上次构建一致，
+        # 则只需重新生成源文件比输出文件新的博文（打包输出时页面不落盘，无法跳过）
+        stamp = None
+        if self.config.build.incremental and not self.config.build.bundle_output:
+            stamp = self._build_stamp(len(posts))
+            stamp_path = Path(self.config.build.cache_dir) / _STAMP_FILE
+            self._skip_unchanged = load_cache(stamp_path) == stamp
+        
+        if self.config.build.parallel and len(posts) >= _PARALLEL_MIN_POSTS:
+            converted_count = self._generate_parallel(posts, blogs_dir)
+        else:
+            # 循环内不变的方法和总数提前绑定为局部变量，避免逐篇重复查找
+            write_one, total_posts = self.write_one, len(posts)
+            converted_count = sum(write_one(post, blogs_dir, total_posts) for post in posts)
+        
+        if self.config.build.incremental:
+            save_cache(self._cache_path, self._rendered, _RENDER_CACHE_SIGNATURE)
+        if stamp is not None:
+            save_cache(stamp_path, stamp)
         
         logger.success(f"博文生成完成，共 {converted_count}/{len(posts)} 篇")
+    
+    def _generate_parallel(self, posts: list[dict], blogs_dir: Path) -> int:
+        """使用进程池并行生成博文
+        
+        Args:
+            posts: 文章列表
+            blogs_dir: 博文输出目录
+            
+        Returns:
+            int: 成功生成的数量
+        """
+        max_workers = self.config.build.max_workers or os.cpu_count() or 1
+        # 每个进程分到若干批，兼顾进程间通信开销和负载均衡
+        chunk_size = max(1, -(-len(posts) // (max_workers * 4)))
+        chunks = [posts[i:i + chunk_size] for i in range(0, len(posts), chunk_size)]
+        
+        # 使用 spawn 启动进程：构建期间可能有其他生成器线程在运行，fork 可能继承到被占用的锁
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(type(self), self.renderer.template_dir, self.config, self.writer is not None),
+        ) as executor:
+            futures = [
+                executor.submit(_write_chunk, chunk, blogs_dir, len(posts), self._skip_unchanged)
+                for chunk in chunks
+            ]
+            converted_count = 0
+            for future in futures:
+                count, pages, rendered = future.result()
+                converted_count += count
+                self._rendered.update(rendered)
+                # 配置了页面写入器时，由主进程将工作进程回传的页面交给写入器
+                for path, data in pages:
+                    self.writer.write(path, data)
+            return converted_count
+    
+    def render_one(self, post: dict, total_posts: int) -> str:
+        """渲染单篇博文
+        
+        Args:
+            post: 文章字典
+            total_posts: 博客总数
+            
+        Returns:
+            str: 完整的 HTML 页面
+        """
+        content_html, toc = self._render_content(post["content"])
+        
+        # 使用模板渲染完整页面
+        return self.renderer.render_post(
+            content_html, 
+            post["metadata"], 
+            total_posts=total_posts,
+            toc=toc
+        )
+    
+    def _render_content(self, content: str) -> tuple[str, list]:
+        """将 Markdown 正文渲染为 HTML 并生成目录
+        
+        按正文摘要去重：同一次构建中正文相同的文章只渲染一次；
+        启用增量构建时还会复用上次构建的结果。
+        
+        Args:
+            content: Markdown 正文
+            
+        Returns:
+            tuple[str, list]: (添加了标题ID的正文 HTML, 目录列表)
+        """
+        key = _content_key(content)
+        result = self._rendered.get(key) or self._render_cache.get(key)
+        if result is None:
+            result = self._render_markdown(content)
+        self._rendered[key] = result
+        return result
+    
+    def _render_markdown(self, content: str) -> tuple[str, list]:
+        """渲染 Markdown 正文并提取目录
+        
+        Args:
+            content: Markdown 正文
+            
+        Returns:
+            tuple[str, list]: (添加了标题ID的正文 HTML, 目录列表)
+        """
+        # 将 Markdown 正文转换为 HTML
+        content_html = self.md_parser.render(content)
+        
+        # 提取目录（TOC），同时为标题添加ID以支持锚点跳转
+        return TocGenerator.process(content_html)
+    
+    def _build_stamp(self, total_posts: int) -> dict:
+        """计算影响所有博文页面的构建戳，任一项变化时所有博文都需重新生成
+        
+        Args:
+            total_posts: 博客总数（显示在每个页面的页脚）
+            
+        Returns:
+            dict: 构建戳
+        """
+        template_mtime = max(
+            (entry.stat().st_mtime_ns for entry in os.scandir(self.renderer.template_dir) if entry.is_file()),
+            default=0,
+        )
+        return {
+            **_RENDER_CACHE_SIGNATURE,
+            "template_engine": self.config.build.template_engine,
+            "templates": template_mtime,
+            "config": self.config.model_dump(exclude={"build", "logging"}),
+            "total_posts": total_posts,
+        }
+    
+    @staticmethod
+    def _is_up_to_date(post: dict, output_path: Path) -> bool:
+        """输出文件是否比源文件新
+        
+        Args:
+            post: 文章字典
+            output_path: 输出文件路径
+            
+        Returns:
+            bool: 输出文件存在且修改时间晚于源文件时返回 True
+        """
+        try:
+            output_mtime = os.stat(output_path).st_mtime_ns
+            source_mtime = post.get("_mtime_ns") or os.stat(post["file_path"]).st_mtime_ns
+        except OSError:
+            return False
+        # 严格晚于：文件系统时间精度较低时，同一时刻修改的源文件仍会重新生成
+        return output_mtime > source_mtime
+    
+    def write_one(self, post: dict, blogs_dir: Path, total_posts: int) -> bool:
+        """渲染并写入单篇博文
+        
+        Args:
+            post: 文章字典
+            blogs_dir: 博文输出目录
+            total_posts: 博客总数
+            
+        Returns:
+            bool: 是否生成成功
+        """
+        try:
+            # 生成输出文件路径（优先使用扫描时预先计算的文件名）
+            output_path = blogs_dir / (post.get("_html_name") or f"{post['file_path'].stem}.html")
+            
+            if self._skip_unchanged and self._is_up_to_date(post, output_path):
+                # 保留该文章的渲染缓存，模板或配置变化后仍可复用
+                key = _content_key(post["content"])
+                if key in self._render_cache:
+                    self._rendered[key] = self._render_cache[key]
+                if self._debug:
+                    logger.debug("未修改，跳过: {}", output_path.name)
+                return True
+            
+            html = self.render_one(post, total_posts)
+            
+            # 写入文件
+            self._write_html(output_path, html)
+            
+            if self._debug:
+                logger.debug("已生成: {}", output_path.name)
+            return True
+        except Exception as e:
+            logger.error(f"生成博文 {post['file_path'].name} 失败: {e}")
+            return False
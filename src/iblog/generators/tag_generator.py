@@ -1,9 +1,11 @@
 """标签生成器：生成按标签组织的文章视图"""
 
+from collections import defaultdict
+from operator import itemgetter
 from pathlib import Path
 from loguru import logger
 
-from .base_generator import BaseGenerator
+from .base_generator import BaseGenerator, _post_date, _post_tags
 
 
 class TagGenerator(BaseGenerator):
@@ -22,10 +24,8 @@ class TagGenerator(BaseGenerator):
             posts: 文章列表
             output_dir: 输出根目录
         """
-        output_dir = Path(output_dir)
         # 使用配置的输出路径
         tags_dir = output_dir / self.config.paths.output.tags
-        tags_dir.mkdir(parents=True, exist_ok=True)
         
         logger.info("开始生成标签视图")
         
@@ -47,38 +47,37 @@ class TagGenerator(BaseGenerator):
         # 3. 生成标签云索引页
         self._render_tags_index(tag_stats, tags_dir, total_posts=len(posts))
         
-        # 4. 为每个标签生成详情页
-        for name, tag_posts in tags_dict.items():
-            self._render_tag_detail(name, tag_posts, tags_dir, total_posts=len(posts))
+        # 4. 为每个标签生成详情页（启用并行构建时并发渲染）
+        self._run_all(
+            lambda item: self._render_tag_detail(item[0], item[1], tags_dir, total_posts=len(posts)),
+            tags_dict.items(),
+        )
         
         logger.success(f"标签视图生成完成，共 {len(tags_dict)} 个标签")
     
     def _group_by_tags(self, posts: list[dict]) -> dict[str, list]:
         """按标签分组文章（一篇文章可属于多个标签）
         
+        先对全部文章按日期排序一次再分组，每个标签下的文章即按日期降序排列，
+        详情页无需再逐个排序。
+        
         Args:
             posts: 文章列表
             
         Returns:
-            dict[str, list]: 标签名到文章列表的映射
+            dict[str, list]: 标签名到文章列表（按日期降序）的映射，标签按在 posts 中首次出现的顺序排列
         """
-        tags_dict = {}
+        tags_dict = defaultdict(list)
         
-        for post in posts:
-            # 获取文章的标签列表
-            tags = post["metadata"].get("tags", [])
-            
-            # 如果 tags 不是列表，跳过
-            if not isinstance(tags, list):
-                continue
-            
+        for post in sorted(posts, key=_post_date, reverse=True):
+            # MetadataParser.validate_metadata 已将 tags 规范化为列表，无需再检查类型
             # 将文章添加到每个标签的列表中
-            for tag in tags:
-                if tag not in tags_dict:
-                    tags_dict[tag] = []
+            for tag in _post_tags(post):
                 tags_dict[tag].append(post)
         
-        return tags_dict
+        # 标签顺序与按原文章顺序分组时一致（决定文章数相同的标签在标签云中的先后）
+        tag_order = dict.fromkeys(tag for post in posts for tag in _post_tags(post))
+        return {tag: tags_dict[tag] for tag in tag_order}
     
     def _calculate_tag_stats(self, tags_dict: dict) -> list[dict]:
         """计算标签统计信息，包括动态字体大小
@@ -89,30 +88,32 @@ class TagGenerator(BaseGenerator):
         Returns:
             list[dict]: 标签统计信息列表，包含 name, count, url, font_size
         """
-        tag_stats = []
-        
-        # 找出最大文章数量，用于计算字体大小
-        max_count = max(len(posts) for posts in tags_dict.values()) if tags_dict else 1
+        # 字体大小只取决于文章数量，每个不同的数量只计算和格式化一次
+        counts = {len(posts) for posts in tags_dict.values()}
+        # 最大文章数量从不同数量的集合中找出，无需再遍历一遍所有标签
+        max_count = max(counts, default=1)
         
-        for name, tag_posts in tags_dict.items():
-            count = len(tag_posts)
-            
+        font_sizes = {}
+        for count in counts:
             # 计算字体大小：0.9em ~ 1.7em
             # 最少文章的标签为 0.9em，最多文章的标签为 1.7em
             if max_count > 1:
-                font_size = 0.9 + (count / max_count) * 0.8
+                font_sizes[count] = f'{0.9 + (count / max_count) * 0.8:.2f}em'
             else:
-                font_size = 1.2  # 如果只有一个标签或所有标签文章数相同，使用中等大小
-            
-            tag_stats.append({
+                font_sizes[count] = '1.20em'  # 如果只有一个标签或所有标签文章数相同，使用中等大小
+        
+        tag_stats = [
+            {
                 'name': name,
-                'count': count,
+                'count': len(tag_posts),
                 'url': f'{name}.html',
-                'font_size': f'{font_size:.2f}em'
-            })
+                'font_size': font_sizes[len(tag_posts)]
+            }
+            for name, tag_posts in tags_dict.items()
+        ]
         
         # 按文章数量降序排序
-        tag_stats.sort(key=lambda x: x['count'], reverse=True)
+        tag_stats.sort(key=itemgetter('count'), reverse=True)
         
         return tag_stats
     
@@ -127,7 +128,7 @@ class TagGenerator(BaseGenerator):
         html = self.renderer.render_tags(tag_stats, total_posts=total_posts)
         
         index_path = tags_dir / "index.html"
-        index_path.write_text(html, encoding="utf-8")
+        self._write_html(index_path, html)
         
         logger.success(f"标签云索引页已生成: {index_path}")
     
@@ -136,21 +137,15 @@ class TagGenerator(BaseGenerator):
         
         Args:
             tag_name: 标签名称
-            posts: 该标签下的文章列表
+            posts: 该标签下的文章列表（已按日期降序排列，最新的在前）
             tags_dir: tags 目录路径
             total_posts: 博客总数
         """
-        # 按日期排序（最新的在前）
-        sorted_posts = sorted(
-            posts,
-            key=lambda p: p["metadata"].get("date", ""),
-            reverse=True
-        )
-        
-        html = self.renderer.render_tag_detail(tag_name, sorted_posts, total_posts=total_posts)
+        html = self.renderer.render_tag_detail(tag_name, posts, total_posts=total_posts)
         
         # 生成文件名
         output_path = tags_dir / f"{tag_name}.html"
-        output_path.write_text(html, encoding="utf-8")
+        self._write_html(output_path, html)
         
-        logger.debug(f"已生成标签页: {tag_name} ({len(posts)} 篇文章)")
+        if self._debug:
+            logger.debug("已生成标签页: {} ({} 篇文章)", tag_name, len(posts))
@@ -0,0 +1,12 @@
+"""测试共用的辅助函数"""
+
+from iblog.core.config_models import Config
+
+
+def make_config(**sections) -> Config:
+    """构造测试用的最小配置"""
+    return Config(
+        site={"title": "测试博客", "subtitle": "", "author": "tester", "start_date": "2026-01-01"},
+        footer={"copyright": "test"},
+        **sections,
+    )
@@ -1,13 +1,20 @@
 """核心层单元测试"""
 
+import os
 import unittest
 from pathlib import Path
 import tempfile
 import shutil
+import zipfile
 
-from iblog.core.metadata_parser import MetadataParser
+from iblog.core.metadata_parser import MetadataParser, split_frontmatter
 from iblog.core.file_scanner import FileScanner
 from iblog.core.template_renderer import TemplateRenderer
+from iblog.core.config_loader import ConfigLoader
+from iblog.core.toc_generator import TocGenerator
+from iblog.core.file_writer import BackgroundWriter, BundleWriter
+
+from tests.helpers import make_config
 
 
 class TestMetadataParser(unittest.TestCase):
@@ -70,6 +77,62 @@ category: 测试
         self.assertIsInstance(validated["tags"], list)
 
 
+class TestSplitFrontmatter(unittest.TestCase):
+    """测试 Frontmatter 拆分"""
+    
+    def test_split_valid_frontmatter(self):
+        """测试拆分有效的 Frontmatter，正文中的分隔线不受影响"""
+        metadata, content = split_frontmatter("---\ntitle: 测试\ntags: [a, b]\n---\n\n正文\n\n---\n\n结尾\n")
+        self.assertEqual(metadata, {"title": "测试", "tags": ["a", "b"]})
+        self.assertEqual(content, "正文\n\n---\n\n结尾")
+    
+    def test_split_without_frontmatter(self):
+        """测试没有 Frontmatter 或缺少结束分隔符的内容"""
+        self.assertEqual(split_frontmatter("# 标题\n\n正文"), ({}, "# 标题\n\n正文"))
+        self.assertEqual(split_frontmatter("---\ntitle: 测试\n正文"), ({}, "---\ntitle: 测试\n正文"))
+    
+    def test_split_crlf(self):
+        """测试 Windows 换行符"""
+        metadata, content = split_frontmatter("---\r\ntitle: 测试\r\n---\r\n正文\r\n")
+        self.assertEqual(metadata, {"title": "测试"})
+        self.assertEqual(content, "正文")
+    
+    def test_split_bytes(self):
+        """测试直接传入 UTF-8 字节"""
+        metadata, content = split_frontmatter("---\ntitle: 测试\n---\n正文\n".encode("utf-8"))
+        self.assertEqual(metadata, {"title": "测试"})
+        self.assertEqual(content, "正文")
+
+
+class TestTocGenerator(unittest.TestCase):
+    """测试目录生成"""
+    
+    HTML = "<h1>标题</h1>\n<p>正文</p>\n<h2>A &amp; B</h2>\n<h2><code>code</code> 标题</h2>\n<h2>A &amp; B</h2>\n"
+    
+    def test_extract_toc(self):
+        """测试提取目录（包括实体和行内标签，重复标题生成唯一 ID）"""
+        toc = TocGenerator.extract_toc(self.HTML)
+        self.assertEqual([(t["level"], t["text"], t["id"]) for t in toc], [
+            (1, "标题", "标题"),
+            (2, "A & B", "a-b"),
+            (2, "code 标题", "code-标题"),
+            (2, "A & B", "a-b-1"),
+        ])
+    
+    def test_add_heading_ids(self):
+        """测试为每个标题添加与目录一致的 ID"""
+        html = TocGenerator.add_heading_ids(self.HTML)
+        self.assertIn('<h2 id="a-b">A &amp; B</h2>', html)
+        self.assertIn('<h2 id="code-标题"><code>code</code> 标题</h2>', html)
+        self.assertIn('<h2 id="a-b-1">A &amp; B</h2>', html)
+    
+    def test_process(self):
+        """测试单遍处理与分别调用的结果一致"""
+        html, toc = TocGenerator.process(self.HTML)
+        self.assertEqual(html, TocGenerator.add_heading_ids(self.HTML))
+        self.assertEqual(toc, TocGenerator.extract_toc(self.HTML))
+
+
 class TestFileScanner(unittest.TestCase):
     """测试文件扫描器"""
     
@@ -166,7 +229,7 @@ class TestTemplateRenderer(unittest.TestCase):
     
     def setUp(self):
         # 使用项目的模板目录
-        template_dir = Path(__file__).parent.parent / "templates"
+        template_dir = Path(__file__).parent.parent / "src" / "iblog" / "templates"
         self.renderer = TemplateRenderer(template_dir)
     
     def test_render_post(self):
@@ -211,5 +274,218 @@ class TestTemplateRenderer(unittest.TestCase):
         self.assertIn("blogs/post1.html", html)
 
 
+class TestSortByPinnedAndDate(unittest.TestCase):
+    """测试置顶排序"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        for name, date, pinned in [("a", "2026-02-01", False), ("b", "2026-02-03", False),
+                                   ("c", "2026-01-01", True), ("d", "2026-02-02", False)]:
+            (self.temp_path / f"{name}.md").write_text(
+                f"---\ntitle: {name}\ndate: {date}\npinned: {str(pinned).lower()}\n---\n\n内容\n",
+                encoding="utf-8")
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def _sorted_titles(self, order: str) -> list[str]:
+        config = make_config(posts={"sort": {"order": order}})
+        scanner = FileScanner(MetadataParser(config), config)
+        posts = scanner.sort_by_pinned_and_date(scanner.scan_directory(self.temp_path))
+        return [p["metadata"]["title"] for p in posts]
+    
+    def test_pinned_first_desc(self):
+        """测试降序时置顶文章在前"""
+        self.assertEqual(self._sorted_titles("desc"), ["c", "b", "d", "a"])
+    
+    def test_pinned_first_asc(self):
+        """测试升序时置顶文章仍在前"""
+        self.assertEqual(self._sorted_titles("asc"), ["c", "a", "d", "b"])
+
+
+class TestFileScannerHandBuiltPosts(unittest.TestCase):
+    """测试排序、分组辅助方法可处理未经扫描预计算字段的文章字典"""
+    
+    def setUp(self):
+        config = make_config()
+        self.scanner = FileScanner(MetadataParser(config), config)
+        self.posts = [
+            {"file_path": Path("a.md"), "metadata": {"title": "a", "date": "2026-01-01", "tags": ["python"]},
+             "content": ""},
+            {"file_path": Path("b.md"), "metadata": {"title": "b", "date": "2026-02-01", "category": "生活"},
+             "content": ""},
+        ]
+    
+    def test_group_by_category(self):
+        """测试缺少 _cat 时按 metadata 分组，未设置分类的文章归入默认分类"""
+        grouped = self.scanner.group_by_category(self.posts)
+        default_category = self.scanner.config.posts.defaults.category
+        self.assertEqual([p["metadata"]["title"] for p in grouped[default_category]], ["a"])
+        self.assertEqual([p["metadata"]["title"] for p in grouped["生活"]], ["b"])
+    
+    def test_group_by_tags(self):
+        """测试缺少 _tags 时按 metadata 分组"""
+        grouped = self.scanner.group_by_tags(self.posts)
+        self.assertEqual(list(grouped), ["python"])
+    
+    def test_sort_by_pinned_and_date(self):
+        """测试缺少 _pinned、_sort 时按 metadata 排序"""
+        self.posts[0]["metadata"]["pinned"] = True
+        sorted_posts = self.scanner.sort_by_pinned_and_date(self.posts)
+        self.assertEqual([p["metadata"]["title"] for p in sorted_posts], ["a", "b"])
+
+
+class TestFileScannerExclude(unittest.TestCase):
+    """测试排除规则"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        for name in ["post.md", "_draft.md", "about.md", "skip.md", "notes.txt"]:
+            (self.temp_path / name).write_text("---\ntitle: t\n---\n\n内容\n", encoding="utf-8")
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def test_exclude_patterns(self):
+        """测试配置的 glob 模式和文件名均被排除"""
+        config = make_config(build={"exclude": ["_*", "skip.md"]})
+        scanner = FileScanner(MetadataParser(config), config)
+        posts = scanner.scan_directory(self.temp_path)
+        self.assertEqual([p["file_path"].name for p in posts], ["post.md"])
+    
+    def test_skip_drafts(self):
+        """测试跳过草稿（包括头部超出预读范围的草稿），开启 drafts 后保留"""
+        (self.temp_path / "draft1.md").write_text("---\ntitle: 草稿\ndraft: true\n---\n\n内容\n", encoding="utf-8")
+        long_header = "".join(f"key{i}: {'x' * 50}\n" for i in range(100))
+        (self.temp_path / "draft2.md").write_text(f"---\n{long_header}draft: true\n---\n\n内容\n", encoding="utf-8")
+        
+        config = make_config(build={"exclude": ["_*", "skip.md"]})
+        posts = FileScanner(MetadataParser(config), config).scan_directory(self.temp_path)
+        self.assertEqual([p["file_path"].name for p in posts], ["post.md"])
+        
+        config = make_config(build={"exclude": ["_*", "skip.md"], "drafts": True})
+        posts = FileScanner(MetadataParser(config), config).scan_directory(self.temp_path)
+        self.assertEqual(len(posts), 3)
+
+
+class TestFileScannerCache(unittest.TestCase):
+    """测试增量构建缓存"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        self.md_dir = self.temp_path / "posts"
+        self.md_dir.mkdir()
+        self.config = make_config(build={"incremental": True, "cache_dir": str(self.temp_path / "cache")})
+        (self.md_dir / "post1.md").write_text("---\ntitle: 文章1\n---\n\n内容1\n", encoding="utf-8")
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def _scan(self) -> list[dict]:
+        scanner = FileScanner(MetadataParser(self.config), self.config)
+        return scanner.scan_directory(self.md_dir)
+    
+    def test_cache_reused_when_unchanged(self):
+        """测试未修改的文件直接复用缓存"""
+        self._scan()
+        self.assertTrue((self.temp_path / "cache" / "posts.pkl").exists())
+        
+        # 解析器不应被再次调用
+        original_parse = MetadataParser.parse
+        MetadataParser.parse = lambda *args, **kwargs: self.fail("不应重新解析")
+        try:
+            posts = self._scan()
+        finally:
+            MetadataParser.parse = original_parse
+        self.assertEqual(posts[0]["metadata"]["title"], "文章1")
+    
+    def test_cache_invalidated_when_modified(self):
+        """测试文件修改后重新解析"""
+        self._scan()
+        (self.md_dir / "post1.md").write_text("---\ntitle: 新标题\n---\n\n新内容\n", encoding="utf-8")
+        posts = self._scan()
+        self.assertEqual(posts[0]["metadata"]["title"], "新标题")
+
+
+class TestBackgroundWriter(unittest.TestCase):
+    """测试后台文件写入器"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def test_close_waits_for_pending_writes(self):
+        """测试 close() 返回时所有文件均已写完"""
+        writer = BackgroundWriter(max_pending=2)
+        for i in range(10):
+            writer.write(self.temp_path / f"{i}.html", f"页面{i}".encode("utf-8"))
+        writer.close()
+        
+        for i in range(10):
+            self.assertEqual((self.temp_path / f"{i}.html").read_text(encoding="utf-8"), f"页面{i}")
+    
+    def test_write_error_raised_on_close(self):
+        """测试写入失败的异常在 close() 时抛出"""
+        writer = BackgroundWriter()
+        writer.write(self.temp_path / "missing" / "a.html", b"x")
+        with self.assertRaises(FileNotFoundError):
+            writer.close()
+
+
+class TestBundleWriter(unittest.TestCase):
+    """测试打包输出"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def test_pages_written_to_single_archive(self):
+        """测试页面以相对路径写入 site.zip，且不在输出目录生成单独文件"""
+        writer = BundleWriter(self.temp_path)
+        writer.write(self.temp_path / "index.html", "首页".encode("utf-8"))
+        writer.write(self.temp_path / "blogs" / "a.html", b"a")
+        writer.close()
+        
+        self.assertFalse((self.temp_path / "index.html").exists())
+        with zipfile.ZipFile(self.temp_path / "site.zip") as bundle:
+            self.assertEqual(sorted(bundle.namelist()), ["blogs/a.html", "index.html"])
+            self.assertEqual(bundle.read("index.html").decode("utf-8"), "首页")
+
+
+class TestConfigLoaderCache(unittest.TestCase):
+    """测试配置加载缓存"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = Path(self.temp_dir) / "config.yaml"
+        self.source = (Path(__file__).parent.parent / "config.default.yaml").read_text(encoding="utf-8")
+        self.config_path.write_text(self.source, encoding="utf-8")
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def test_unchanged_file_returns_same_config(self):
+        """测试文件未修改时返回同一个配置对象"""
+        self.assertIs(ConfigLoader.load(self.config_path), ConfigLoader.load(self.config_path))
+    
+    def test_edit_with_same_mtime_reloaded(self):
+        """测试修改时间不变的编辑也会重新加载"""
+        config = ConfigLoader.load(self.config_path)
+        st = os.stat(self.config_path)
+        self.config_path.write_text(self.source.replace(config.site.title, "新标题", 1), encoding="utf-8")
+        os.utime(self.config_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        self.assertEqual(ConfigLoader.load(self.config_path).site.title, "新标题")
+
+
 if __name__ == "__main__":
     unittest.main()
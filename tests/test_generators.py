@@ -1,6 +1,8 @@
 """生成器层集成测试"""
 
+import os
 import unittest
+from unittest import mock
 from pathlib import Path
 import tempfile
 import shutil
@@ -10,6 +12,13 @@ from iblog.core.file_scanner import FileScanner
 from iblog.core.template_renderer import TemplateRenderer
 from iblog.generators.post_generator import PostGenerator
 from iblog.generators.index_generator import IndexGenerator
+from iblog.generators import about_generator
+from iblog.generators.about_generator import AboutGenerator
+from iblog.generators.category_generator import CategoryGenerator
+from iblog.generators.tag_generator import TagGenerator
+from iblog.generators.base_generator import ensure_output_dirs
+
+from tests.helpers import make_config
 
 
 class TestPostGenerator(unittest.TestCase):
@@ -17,7 +26,7 @@ class TestPostGenerator(unittest.TestCase):
     
     def setUp(self):
         # 设置组件
-        template_dir = Path(__file__).parent.parent / "templates"
+        template_dir = Path(__file__).parent.parent / "src" / "iblog" / "templates"
         self.renderer = TemplateRenderer(template_dir)
         self.generator = PostGenerator(self.renderer)
         
@@ -55,6 +64,7 @@ class TestPostGenerator(unittest.TestCase):
     
     def test_generate_posts(self):
         """测试生成博文"""
+        ensure_output_dirs(self.output_path, ["blogs"])
         self.generator.generate(self.posts, self.output_path)
         
         # 检查 blogs 目录是否创建
@@ -71,12 +81,250 @@ class TestPostGenerator(unittest.TestCase):
         self.assertIn("内容1", test1_html)
 
 
+class TestPostGeneratorParallel(unittest.TestCase):
+    """测试多进程并行生成博文"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_path = Path(self.temp_dir)
+        config = make_config(build={"parallel": True, "max_workers": 2})
+        template_dir = Path(__file__).parent.parent / "src" / "iblog" / "templates"
+        self.generator = PostGenerator(TemplateRenderer(template_dir, config), config)
+        self.posts = [
+            {
+                "file_path": Path(f"post{i}.md"),
+                "metadata": {"title": f"并行文章{i}", "date": "2026-02-13", "tags": [], "category": "测试"},
+                "content": f"# 标题{i}\n\n内容{i}。"
+            }
+            for i in range(10)
+        ]
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def test_generate_posts_parallel(self):
+        """测试并行生成的结果与串行一致"""
+        ensure_output_dirs(self.output_path, ["blogs"])
+        self.generator.generate(self.posts, self.output_path)
+        
+        blogs_dir = self.output_path / "blogs"
+        self.assertEqual(len(list(blogs_dir.glob("*.html"))), 10)
+        for i, post in enumerate(self.posts):
+            html = (blogs_dir / f"post{i}.html").read_text(encoding="utf-8")
+            self.assertEqual(html, self.generator.render_one(post, total_posts=10))
+
+
+class TestPostGeneratorRenderCache(unittest.TestCase):
+    """测试博文正文渲染结果的增量缓存"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        self.template_dir = Path(__file__).parent.parent / "src" / "iblog" / "templates"
+        self.posts = [
+            {
+                "file_path": Path(f"post{i}.md"),
+                "metadata": {"title": f"缓存文章{i}", "date": "2026-02-13", "tags": [], "category": "测试"},
+                "content": f"# 标题{i}\n\n内容{i}。"
+            }
+            for i in range(10)
+        ]
+        for out in ("out", "out2"):
+            ensure_output_dirs(self.temp_path / out, ["blogs"])
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def _generator(self, **build) -> PostGenerator:
+        config = make_config(build={"incremental": True, "cache_dir": str(self.temp_path / "cache"), **build})
+        return PostGenerator(TemplateRenderer(self.template_dir, config), config)
+    
+    def test_unchanged_content_not_rerendered(self):
+        """测试并行构建的渲染结果被下一次构建复用"""
+        first = self._generator(parallel=True, max_workers=2)
+        first.generate(self.posts, self.temp_path / "out")
+        expected = (self.temp_path / "out" / "blogs" / "post3.html").read_text(encoding="utf-8")
+        
+        second = self._generator()
+        second.md_parser = None  # 若重新渲染 Markdown 将抛出异常
+        second.generate(self.posts, self.temp_path / "out2")
+        html = (self.temp_path / "out2" / "blogs" / "post3.html").read_text(encoding="utf-8")
+        self.assertEqual(html, expected)
+        self.assertIn('id="标题3"', html)
+    
+    def test_identical_content_rendered_once(self):
+        """测试同一次构建中正文相同的文章只渲染一次"""
+        config = make_config()
+        generator = PostGenerator(TemplateRenderer(self.template_dir, config), config)
+        calls = []
+        render = generator.md_parser.render
+        generator.md_parser = type("CountingParser", (), {"render": lambda _, text: calls.append(text) or render(text)})()
+        
+        posts = [dict(post, content="# 相同\n\n正文") for post in self.posts[:3]]
+        generator.generate(posts, self.temp_path / "out")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(list((self.temp_path / "out" / "blogs").glob("*.html"))), 3)
+
+
+class TestPostGeneratorSkipUnchanged(unittest.TestCase):
+    """测试增量构建跳过未修改的博文"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        self.config = make_config(build={"incremental": True, "cache_dir": str(self.temp_path / "cache")})
+        self.template_dir = Path(__file__).parent.parent / "src" / "iblog" / "templates"
+        self.posts = []
+        for i in range(2):
+            source = self.temp_path / f"post{i}.md"
+            source.write_text(f"# 标题{i}", encoding="utf-8")
+            self.posts.append({
+                "file_path": source,
+                "metadata": {"title": f"文章{i}", "date": "2026-02-13", "tags": [], "category": "测试"},
+                "content": f"# 标题{i}"
+            })
+        ensure_output_dirs(self.temp_path / "out", ["blogs"])
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def _generate(self, posts: list[dict]):
+        PostGenerator(TemplateRenderer(self.template_dir, self.config), self.config).generate(posts, self.temp_path / "out")
+    
+    def _mtime(self, name: str) -> int:
+        return (self.temp_path / "out" / "blogs" / name).stat().st_mtime_ns
+    
+    def test_only_modified_posts_regenerated(self):
+        """测试只重新生成源文件比输出新的博文"""
+        self._generate(self.posts)
+        before = [self._mtime("post0.html"), self._mtime("post1.html")]
+        
+        # 将 post1 的源文件修改时间设为晚于输出
+        source = self.posts[1]["file_path"]
+        os.utime(source, ns=(before[1] + 10**9, before[1] + 10**9))
+        self._generate(self.posts)
+        self.assertEqual(self._mtime("post0.html"), before[0])
+        self.assertNotEqual(self._mtime("post1.html"), before[1])
+    
+    def test_all_posts_regenerated_when_total_changes(self):
+        """测试文章总数变化时（页脚显示总数）重新生成所有博文"""
+        self._generate(self.posts)
+        before = self._mtime("post0.html")
+        
+        os.utime(self.temp_path / "out" / "blogs" / "post0.html", ns=(before - 10**9, before - 10**9))
+        os.utime(self.posts[0]["file_path"], ns=(before - 2 * 10**9, before - 2 * 10**9))
+        self._generate(self.posts[:1])
+        self.assertNotEqual(self._mtime("post0.html"), before - 10**9)
+
+
+class TestAboutGeneratorCache(unittest.TestCase):
+    """测试关于页面的增量解析缓存"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        self.config = make_config(build={"incremental": True, "cache_dir": str(self.temp_path / "cache")})
+        self.template_dir = Path(__file__).parent.parent / "src" / "iblog" / "templates"
+        self.about_file = self.temp_path / "about.md"
+        self.about_file.write_text("---\ntitle: 关于我\n---\n\n自我介绍\n", encoding="utf-8")
+        ensure_output_dirs(self.temp_path / "out", ["about"])
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def _generator(self) -> AboutGenerator:
+        return AboutGenerator(TemplateRenderer(self.template_dir, self.config), self.config)
+    
+    def test_unchanged_about_not_reparsed(self):
+        """测试 about.md 未修改时跨构建复用解析结果"""
+        self._generator().generate(self.about_file, self.temp_path / "out")
+        
+        generator = self._generator()
+        generator.md_parser = None  # 若重新渲染 Markdown 将抛出异常
+        generator.generate(self.about_file, self.temp_path / "out")
+        html = (self.temp_path / "out" / "about" / "index.html").read_text(encoding="utf-8")
+        self.assertIn("自我介绍", html)
+    
+    def test_modified_about_reparsed(self):
+        """测试 about.md 修改后重新解析"""
+        self._generator().generate(self.about_file, self.temp_path / "out")
+        self.about_file.write_text("---\ntitle: 关于我\n---\n\n新的介绍内容\n", encoding="utf-8")
+        
+        self._generator().generate(self.about_file, self.temp_path / "out")
+        html = (self.temp_path / "out" / "about" / "index.html").read_text(encoding="utf-8")
+        self.assertIn("新的介绍内容", html)
+    
+    def test_signature_mismatch_rerendered(self):
+        """测试缓存签名不一致（如升级 iblog 或 markdown-it）时重新渲染"""
+        self._generator().generate(self.about_file, self.temp_path / "out")
+        
+        with mock.patch.object(about_generator, "_RENDER_CACHE_SIGNATURE", {"iblog": "0.0.0"}):
+            generator = self._generator()
+        self.assertIsNone(generator._about_cache)
+        generator.generate(self.about_file, self.temp_path / "out")
+        html = (self.temp_path / "out" / "about" / "index.html").read_text(encoding="utf-8")
+        self.assertIn("自我介绍", html)
+    
+    def test_other_about_file_not_served_from_cache(self):
+        """测试换用另一个 mtime、size 相同的 about.md 时不复用缓存"""
+        self._generator().generate(self.about_file, self.temp_path / "out")
+        other = self.temp_path / "other.md"
+        other.write_text("---\ntitle: 关于我\n---\n\n他人介绍\n", encoding="utf-8")
+        st = self.about_file.stat()
+        os.utime(other, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        self._generator().generate(other, self.temp_path / "out")
+        html = (self.temp_path / "out" / "about" / "index.html").read_text(encoding="utf-8")
+        self.assertIn("他人介绍", html)
+
+
+class TestTaxonomyGeneratorsHandBuiltPosts(unittest.TestCase):
+    """测试分类、标签生成器可处理未经 FileScanner 预计算字段的文章字典"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_path = Path(self.temp_dir)
+        self.config = make_config()
+        template_dir = Path(__file__).parent.parent / "src" / "iblog" / "templates"
+        self.renderer = TemplateRenderer(template_dir, self.config)
+        self.posts = [
+            {
+                "file_path": Path("old.md"),
+                "metadata": {"title": "旧文章", "date": "2026-01-01", "tags": ["python"], "category": "技术"},
+                "content": "旧内容"
+            },
+            {
+                "file_path": Path("new.md"),
+                "metadata": {"title": "新文章", "date": "2026-02-01", "tags": ["python"], "category": "技术"},
+                "content": "新内容"
+            }
+        ]
+        ensure_output_dirs(self.output_path, ["categories", "tags"])
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def test_category_generator(self):
+        """测试分类页按日期降序排列手工构造的文章"""
+        CategoryGenerator(self.renderer, self.config).generate(self.posts, self.output_path)
+        
+        html = (self.output_path / "categories" / "技术.html").read_text(encoding="utf-8")
+        self.assertLess(html.index("新文章"), html.index("旧文章"))
+    
+    def test_tag_generator(self):
+        """测试标签页按日期降序排列手工构造的文章"""
+        TagGenerator(self.renderer, self.config).generate(self.posts, self.output_path)
+        
+        html = (self.output_path / "tags" / "python.html").read_text(encoding="utf-8")
+        self.assertLess(html.index("新文章"), html.index("旧文章"))
+
+
 class TestIndexGenerator(unittest.TestCase):
     """测试首页生成器"""
     
     def setUp(self):
         # 设置组件
-        template_dir = Path(__file__).parent.parent / "templates"
+        template_dir = Path(__file__).parent.parent / "src" / "iblog" / "templates"
         self.renderer = TemplateRenderer(template_dir)
         self.generator = IndexGenerator(self.renderer)
         
@@ -142,7 +390,7 @@ class TestEndToEnd(unittest.TestCase):
         # 初始化组件
         self.parser = MetadataParser()
         self.scanner = FileScanner(self.parser)
-        template_dir = Path(__file__).parent.parent / "templates"
+        template_dir = Path(__file__).parent.parent / "src" / "iblog" / "templates"
         self.renderer = TemplateRenderer(template_dir)
     
     def tearDown(self):
@@ -186,6 +434,7 @@ category: 生活
         self.assertEqual(len(posts), 2)
         
         # 2. 生成博文
+        ensure_output_dirs(self.output_path, ["blogs"])
         post_gen = PostGenerator(self.renderer)
         post_gen.generate(posts, self.output_path)
         